@@ -1,11 +1,9 @@
-# TODO: Dynamically discover solutions
 from donner.cli import cli_main
-
-from advent.y2023 import *  # noqa: F403
+from donner.plugins import load_solutions
 
 
 def main():
-    cli_main()
+    cli_main(load_solutions=load_solutions)
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections import deque
 from collections.abc import Iterator
 from dataclasses import dataclass
 from enum import IntEnum
@@ -98,6 +99,11 @@ class Direction(IntEnum):
             )
 
 
+# Each cardinal direction paired with its unit point, built once so that search
+# loops do not construct a new `Point` per step.
+_CARDINAL_STEPS = tuple((dir, dir.to_point()) for dir in Direction.cardinal_dirs())
+
+
 _DIAGONAL_NEIGHBORS = [
     Point(-1, -1),
     Point(0, -1),
@@ -522,9 +528,9 @@ def astar_search(
             break
 
         # Examine all of the cells that are adjacent to this cell.
-        for dir in Direction.cardinal_dirs():
+        for _, step in _CARDINAL_STEPS:
             # Ignore any invalid cell positions.
-            neighbor_pos = current_pos + dir.to_point()
+            neighbor_pos = current_pos + step
 
             if neighbor_pos not in grid:
                 continue
@@ -604,7 +610,7 @@ class BFS(ABC, Generic[T]):
     __slots__ = ("grid", "start_pos", "frontier", "visited")
     grid: Grid[T]
     start_pos: Point
-    frontier: list[Point]
+    frontier: deque[Point]
     visited: set[Point]
 
     def __init__(self, grid: Grid[T], start_pos: Point):
@@ -617,7 +623,7 @@ class BFS(ABC, Generic[T]):
 
         self.grid = grid
         self.start_pos = start_pos
-        self.frontier = []
+        self.frontier = deque()
         self.visited = set()
 
     def reset(self) -> None:
@@ -632,11 +638,11 @@ class BFS(ABC, Generic[T]):
         self.reset()
 
         while len(self.frontier) > 0:
-            cell_pos = self.frontier.pop(0)
+            cell_pos = self.frontier.popleft()
             self.visited.add(cell_pos)
 
-            for dir in Direction.cardinal_dirs():
-                neighbor_pos = cell_pos + dir.to_point()
+            for dir, step in _CARDINAL_STEPS:
+                neighbor_pos = cell_pos + step
 
                 if (
                     self.grid.check_in_bounds(neighbor_pos)
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from advent.spatial import Grid
 from collections.abc import Iterator
+from operator import attrgetter
 from typing import (
     Callable,
     Generator,
@@ -14,6 +15,8 @@ import re
 
 T = TypeVar("T")
 
+_INT_RE = re.compile(r"-?[0-9]+")
+
 
 class ValueCanNotBeNoneError(Exception):
     def __init__(self):
@@ -73,7 +76,7 @@ def split(
 
 def find_ints(text: str) -> list[int]:
     """Returns all the integers found in the text string and ignores any non-number characters."""
-    return list(map(int, re.findall(r"-?[0-9]+", text)))
+    return list(map(int, _INT_RE.findall(text)))
 
 
 def find_digits(text: str) -> list[int]:
@@ -133,13 +136,7 @@ def count_if(itr: Iterable[T] | Iterator[T], pred: Callable[[T], bool]) -> int:
         count_if([1, 2, 3, 4], lambda x: x % 2 == 0) # returns 2
     ```
     """
-    count = 0
-
-    for x in itr:
-        if pred(x):
-            count += 1
-
-    return count
+    return sum(1 for x in itr if pred(x))
 
 
 def first(iterable: Iterable[T] | Iterator[T], default: T | None = None) -> T | None:
@@ -226,7 +223,7 @@ def combinations(k: int, items: list[T]) -> Generator[list[T], None, None]:
     yield from step(0, k, 0, items, scratch)
 
 
-@dataclass(order=True)
+@dataclass(order=True, slots=True)
 class Range:
     start: int
     length: int
@@ -334,16 +331,18 @@ def merge_ranges(ranges_in: list[Range]) -> list[Range]:
     if len(ranges_in) <= 1:
         return ranges_in
 
-    # Sort the ranges in increaing order based on the starting value.
-    ranges = sorted(ranges_in)
+    # Sort the ranges in increaing order based on the starting value. Sorting
+    # by the start attribute avoids calling the dataclass generated `__lt__`
+    # for every comparison.
+    ranges = iter(sorted(ranges_in, key=attrgetter("start")))
 
     # Push the first range on the stack. This range is the one with the lowest
     # start value.
-    out_ranges = [ranges[0]]
+    out_ranges = [next(ranges)]
 
     # Iterate through the remaining ranges in increasing order based on the
     # starting value.
-    for next_r in ranges[1:]:
+    for next_r in ranges:
         top_r = out_ranges[-1]
 
         # Does the next unprocessed range overlap the range at the top of the
@@ -1,11 +1,9 @@
-from dataclasses import dataclass
-from advent.spatial import ConnectedTile, Direction, Grid
+from collections import deque
+from advent.spatial import Direction
 from donner.annotations import solver, example
 from donner.solution import AbstractSolver
 from enum import IntEnum
 
-from oatmeal import Point
-
 
 class TileType(IntEnum):
     """
@@ -79,97 +77,176 @@ LETTER_TO_TILE = {
     "S": TileType.Start,
 }
 
-NEIGHBORS = [
-    (TileType.NorthToEast, Direction.North, Direction.East),
-    (TileType.NorthToWest, Direction.North, Direction.South),
-    (TileType.SouthToWest, Direction.South, Direction.West),
-    (TileType.SouthToEast, Direction.South, Direction.East),
-]
-
-
-# TODO: Verify <= 2 edges set.
-@dataclass
-class Tile(ConnectedTile):
-    is_start: bool
-
-    def __init__(self, tile_type: TileType, is_start=False):
-        # super().__init__(0, tile_type if tile_type != TileType.Start else None)
-
-        # if tile_type == TileType.Start:
-        #    self.edge_connections = 0
-        #    self.is_start = True
-        # else:
-        #    self.edge_connections = int(tile_type)
-        #    self.is_start = is_start
-        pass
-
-    @staticmethod
-    def parse(c: str) -> "Tile":
-        if c in LETTER_TO_TILE:
-            return Tile(LETTER_TO_TILE[c])
-        else:
-            raise ValueError(f"unknown tile letter `{c}`")
-
-    def type(self):
-        edges = self.edge_connections
-
-        if edges == 0:
-            return TileType.Ground
-        elif edges == 10:
-            return TileType.Vertical
-        elif edges == 5:
-            return TileType.Horizontal
-        elif edges == 3:
-            return TileType.NorthToEast
-        elif edges == 6:
-            return TileType.NorthToWest
-        elif edges == 12:
-            return TileType.SouthToWest
-        elif edges == 9:
-            return TileType.SouthToEast
-        else:
-            raise ValueError("unknown tile type value = {edges}")
-
-    def __str__(self):
-        return TILE_TO_UNICODE[self.type()]
-
-
-def parse_grid_input(input: str) -> Grid[Tile]:
-    lines = input.splitlines()
-    y_count = len(lines)
-    x_count = len(lines[0])
-    grid = Grid(x_count, y_count, lambda x, y: Tile.parse(lines[y][x]))
-
-    for y in range(0, y_count):
-        for x in range(0, x_count):
-            pt = Point(x, y)
-            tile = grid[pt]
-
-            if tile.is_start:
-                print(f"is_start tile at {pt}")
-                did_find_neighbor = False
-
-                for tile_type, dir_a, dir_b in NEIGHBORS:
-                    pt_a = pt + dir_a.to_point()
-                    pt_b = pt + dir_b.to_point()
-
-                    print(
-                        f"check {dir_a} {pt_a} has {grid[pt_a].edge_connections} = {grid[pt_a].edge(dir_a.reverse())} and {dir_b} {pt_b} has {grid[pt_b].edge_connections} = {grid[pt_b].edge(dir_b.reverse())}"
-                    )
-
-                    if (
-                        grid.check_in_bounds(pt_a)
-                        and grid.check_in_bounds(pt_b)
-                        and grid[pt_a].edge(dir_a.reverse())
-                        and grid[pt_b].edge(dir_b.reverse())
-                    ):
-                        grid[pt] = Tile(tile_type, is_start=True)
-                        did_find_neighbor = True
-
-                if not did_find_neighbor:
-                    raise Exception("could not find a neighbor for start tile")
-
-    return grid
+# Maps each byte of an input line directly to its tile type, with 255 for
+# bytes that are not a tile letter. Used with `bytes.translate`.
+_LETTER_TO_MASK = bytes(
+    LETTER_TO_TILE[chr(b)] if chr(b) in LETTER_TO_TILE else 255 for b in range(256)
+)
+
+# Maps a tile type to the ASCII digit `1` when it has a pipe leading north and
+# `0` otherwise. Used with `bytes.translate`.
+_NORTH_EDGE_TO_DIGIT = bytes(
+    ord("1") if b & (1 << Direction.North) else ord("0") for b in range(256)
+)
+
+# Each cardinal direction paired with the direction pointing back at it.
+_CARDINAL_REVERSES = tuple((dir, dir.reverse()) for dir in Direction.cardinal_dirs())
+
+
+class PipeMaze:
+    """
+    A pipe maze stored as flat row-major arrays with one entry per tile, rather
+    than as a grid of tile objects.
+
+    The maze is surrounded by a border of ground tiles so that every tile in the
+    puzzle has four neighbors and stepping in any direction never needs a
+    bounds check. `connections[i]` holds the tile type bitmask for the tile at
+    index `i = (y + 1) * stride + (x + 1)`, where `stride` is `width + 2`, and
+    `start` is the index of the start tile. The start tile's connections are
+    inferred from the neighbors that connect to it.
+    """
+
+    __slots__ = ("width", "height", "stride", "connections", "start")
+    width: int
+    height: int
+    stride: int
+    connections: bytearray
+    start: int
+
+    def __init__(self, input: str):
+        lines = input.splitlines()
+        self.width = len(lines[0])
+        self.height = len(lines)
+        self.stride = self.width + 2
+
+        border = bytes(self.stride)
+        self.connections = bytearray(
+            border
+            + b"".join(
+                b"\0" + line.encode().translate(_LETTER_TO_MASK) + b"\0"
+                for line in lines
+            )
+            + border
+        )
+
+        if 255 in self.connections:
+            y, x = divmod(self.connections.index(255), self.stride)
+            raise ValueError(f"unknown tile letter `{lines[y - 1][x - 1]}`")
+
+        self.start = self.connections.find(TileType.Start)
+
+        if self.start < 0:
+            raise ValueError("pipe maze is missing a start tile")
+
+        # The start tile connects to the two ends of the pipe that loops back
+        # around to it. Other neighbors may also have a pipe leading to the
+        # start tile without being part of the loop, so each candidate pipe is
+        # followed to check that it returns.
+        start_mask = 0
+
+        for dir, reverse in _CARDINAL_REVERSES:
+            neighbor = self.start + self.offset(dir)
+
+            if self.connections[neighbor] & (1 << reverse):
+                return_dir = self._follow_pipe(dir)
+
+                if return_dir is not None:
+                    start_mask = (1 << dir) | (1 << return_dir)
+                    break
+
+        self.connections[self.start] = start_mask
+
+    def offset(self, dir: Direction) -> int:
+        """Returns the change in index when stepping one tile in `dir`."""
+        return (1, -self.stride, -1, self.stride)[dir]
+
+    def _follow_pipe(self, dir: Direction) -> Direction | None:
+        """Follows the pipe leaving the start tile in direction `dir`. Returns
+        the direction the start tile must connect in for the pipe to lead back
+        to it, or `None` if the pipe comes to a dead end."""
+        connections = self.connections
+        index = self.start
+
+        while True:
+            index += self.offset(dir)
+            entry = dir.reverse()
+
+            if index == self.start:
+                return entry
+
+            # Leave the tile through its other connection. Every pipe has two
+            # connections, so removing the one that was entered leaves a single
+            # bit.
+            mask = connections[index]
+
+            if not mask & (1 << entry):
+                return None
+
+            dir = Direction((mask ^ (1 << entry)).bit_length() - 1)
+
+    def loop_distances(self) -> list[int]:
+        """Returns the number of steps along the main loop from the start tile
+        to every tile, with `-1` for tiles that are not part of the loop."""
+        connections = self.connections
+        distances = [-1] * len(connections)
+        distances[self.start] = 0
+        frontier = deque([self.start])
+
+        # (edge bit, index offset, reverse edge bit) for each direction.
+        steps = tuple(
+            (1 << dir, self.offset(dir), 1 << reverse)
+            for dir, reverse in _CARDINAL_REVERSES
+        )
+
+        while len(frontier) > 0:
+            index = frontier.popleft()
+            mask = connections[index]
+            next_distance = distances[index] + 1
+
+            for bit, offset, reverse_bit in steps:
+                if mask & bit:
+                    neighbor = index + offset
+
+                    # Tiles on the edge of the maze can point at the border,
+                    # which never has a pipe leading back.
+                    if distances[neighbor] < 0 and connections[neighbor] & reverse_bit:
+                        distances[neighbor] = next_distance
+                        frontier.append(neighbor)
+
+        return distances
+
+    def enclosed_area(self) -> int:
+        """Returns the number of tiles that are enclosed by the main loop."""
+        distances = self.loop_distances()
+
+        # Pack the maze into big integers with bit `i` standing for tile `i`.
+        # `int(..., 2)` reads the most significant digit first, hence the
+        # reversed digit strings.
+        loop_digits = bytearray(b"0") * len(distances)
+
+        for index, distance in enumerate(distances):
+            if distance >= 0:
+                loop_digits[index] = ord("1")
+
+        loop = int(loop_digits[::-1], 2)
+        walls = int(self.connections.translate(_NORTH_EDGE_TO_DIGIT)[::-1], 2) & loop
+
+        # A tile is inside the loop when an odd number of walls come before it
+        # in its row, where a wall is a loop tile with a pipe leading north.
+        # Only counting north edges means a run like `└─┐` is a single crossing
+        # while a run like `└─┘` is not a crossing at all. Every row crosses
+        # the loop an even number of times, so a prefix XOR over the whole
+        # maze gives each tile the parity of its own row. The prefix XOR is
+        # built from log2(n) shift-and-XOR steps.
+        inside = walls
+        shift = 1
+
+        while shift < len(distances):
+            inside ^= inside << shift
+            shift <<= 1
+
+        inside &= (1 << len(distances)) - 1
+        return (inside & ~loop).bit_count()
 
 
 @solver(day=10, year=2023, name="Pipe Maze")
@@ -193,12 +270,62 @@ def parse_grid_input(input: str) -> Grid[Tile]:
     ],
     part_one="8",
 )
+@example(
+    input=[
+        "...........",
+        ".S-------7.",
+        ".|F-----7|.",
+        ".||.....||.",
+        ".||.....||.",
+        ".|L-7.F-J|.",
+        ".|..|.|..|.",
+        ".L--J.L--J.",
+        "...........",
+    ],
+    part_two="4",
+)
+@example(
+    input=[
+        ".F----7F7F7F7F-7....",
+        ".|F--7||||||||FJ....",
+        ".||.FJ||||||||L7....",
+        "FJL7L7LJLJ||LJ.L-7..",
+        "L--J.L7...LJS7F-7L7.",
+        "....F-J..F7FJ|L7L7L7",
+        "....L7.F7||L7|.L7L7|",
+        ".....|FJLJ|FJ|F7|.LJ",
+        "....FJL-7.||.||||...",
+        "....L---J.LJ.LJLJ...",
+    ],
+    part_two="8",
+)
+@example(
+    input=[
+        "FF7FSF7F7F7F7F7F---7",
+        "L|LJ||||||||||||F--J",
+        "FL-7LJLJ||||||LJL-77",
+        "F--JF--7||LJLJ7F7FJ-",
+        "L---JF-JLJ.||-FJLJJ7",
+        "|F|F-JF---7F7-L7L|7|",
+        "|FFJF7L7F-JF7|JL---7",
+        "7-L-JL7||F7|L7F-7F7|",
+        "L.L7LFJ|||||FJL7||LJ",
+        "L7JLJL-JLJLJL--JLJ.L",
+    ],
+    part_two="10",
+)
+@example(
+    input=[
+        "JF7",
+        "|||",
+        ".||",
+        "LSJ",
+    ],
+    part_two="0",
+)
 class Day10Solver(AbstractSolver):
     def part_one(self, input: str) -> int | str | None:
-        # grid = parse_grid_input(input)
-        # print(grid)
-        print("testing 123")
-        return 1
+        return max(PipeMaze(input).loop_distances())
 
     def part_two(self, input: str) -> int | str | None:
-        return None
+        return PipeMaze(input).enclosed_area()
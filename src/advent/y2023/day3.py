@@ -1,78 +1,69 @@
+from bisect import bisect_right
 from dataclasses import dataclass
-from advent.spatial import Grid
-from advent.utils import new_grid_from_input_lines
 from donner.annotations import example, solver
 from donner.solution import AbstractSolver
-from oatmeal import Point
 import logging
+import re
 
 
-@dataclass
+_NUMBER_RE = re.compile(r"\d+")
+
+
+@dataclass(slots=True)
 class Symbol:
     sym: str
     part_numbers: list[int]
 
 
-def find_symbols_and_adjacent_part_numbers(schematic: Grid[str]) -> list[Symbol]:
-    # Walk through the schematic grid starting at the top left. For each
-    # symbol (any non-numeric non-period) record all of the numbers adjacent
-    # to it.
-    symbols: list[Symbol] = []
+def find_symbols_and_adjacent_part_numbers(schematic: list[str]) -> list[Symbol]:
+    # Find the span of every number in the schematic up front, one row at a
+    # time. Each row's spans are in left to right order so the numbers next to
+    # a symbol can be found with a binary search on their starting column.
+    numbers = [
+        [(m.start(), m.end(), int(m.group())) for m in _NUMBER_RE.finditer(line)]
+        for line in schematic
+    ]
+    starts = [[start for start, _, _ in row] for row in numbers]
 
-    for y in range(0, schematic.row_count()):
-        for x in range(0, schematic.col_count()):
-            xy_pos = Point(x, y)
-            c = schematic[xy_pos]
+    # Numbers that have already been attached to a symbol, by row and index.
+    claimed: set[tuple[int, int]] = set()
+
+    # Walk through the schematic starting at the top left. For each symbol
+    # (any non-numeric non-period) record all of the numbers adjacent to it.
+    symbols: list[Symbol] = []
 
+    for y, line in enumerate(schematic):
+        for x, c in enumerate(line):
             # Skip cells that are not a gear symbol.
             if c.isdigit() or c == ".":
                 continue
 
-            logging.debug(f"found symbol {c} at {xy_pos}")
-
-            # Look at the cells that neighbor this symbol. Are any of those
-            # cells part of a number?
-            numbers: list[int] = []
-
-            for n_pos in schematic.diagonal_neighbors(xy_pos):
-                if schematic[n_pos].isdigit():
-                    # This cell is a digit in a larger number that is adjacent
-                    # to the current symbol.
-                    #
-                    # Scan to the left to find the start of the number, and scan
-                    # to the right to find the end of the number.
-                    left = n_pos.x
-                    while left > 0 and schematic[Point(left - 1, n_pos.y)].isdigit():
-                        left -= 1
-
-                    right = n_pos.x
-                    while (
-                        right < schematic.x_count - 1
-                        and schematic[Point(right + 1, n_pos.y)].isdigit()
-                    ):
-                        right += 1
-
-                    # Extract the number by walking through each digit from left
-                    # to right. Make sure to zero out each digit after scanning
-                    # it to prevent the number from being attached to more than
-                    # one symbol
-                    number = 0
-
-                    for xi in range(left, right + 1):
-                        xi_pos = Point(xi, n_pos.y)
-                        number = int(schematic[xi_pos]) + number * 10
-
-                        schematic[xi_pos] = "."
-
-                    logging.debug(
-                        f"adding number `{number}` from {n_pos} part of {c} at {xy_pos}"
-                    )
-
-                    # Add the part number to the current symbol.
-                    numbers.append(number)
+            logging.debug(f"found symbol {c} at {x}, {y}")
+
+            # Look at the rows above, on and below this symbol. A number is
+            # adjacent when it starts at or before the column to the right of
+            # the symbol and ends at or after the column to the left of it.
+            part_numbers: list[int] = []
+
+            for ny in range(max(y - 1, 0), min(y + 2, len(schematic))):
+                row = numbers[ny]
+                i = bisect_right(starts[ny], x + 1) - 1
+
+                while i >= 0 and row[i][1] >= x:
+                    # Only attach a number to the first symbol found next to
+                    # it.
+                    if (ny, i) not in claimed:
+                        claimed.add((ny, i))
+                        part_numbers.append(row[i][2])
+
+                        logging.debug(
+                            f"adding number `{row[i][2]}` part of {c} at {x}, {y}"
+                        )
+
+                    i -= 1
 
             # Add the symbol to the list of all symbols found in the schematic.
-            symbols.append(Symbol(c, numbers))
+            symbols.append(Symbol(c, part_numbers))
 
     return symbols
 
@@ -96,8 +87,7 @@ def find_symbols_and_adjacent_part_numbers(schematic: Grid[str]) -> list[Symbol]
 )
 class Day2Solver(AbstractSolver):
     def part_one(self, input: str) -> int | str | None:
-        schematic = new_grid_from_input_lines(input.splitlines())
-        symbols = find_symbols_and_adjacent_part_numbers(schematic)
+        symbols = find_symbols_and_adjacent_part_numbers(input.splitlines())
 
         # Sum all of the part numbers associated with a symbol in the schematic.
         sum = 0
@@ -109,8 +99,7 @@ class Day2Solver(AbstractSolver):
         return sum
 
     def part_two(self, input: str) -> int | str | None:
-        schematic = new_grid_from_input_lines(input.splitlines())
-        symbols = find_symbols_and_adjacent_part_numbers(schematic)
+        symbols = find_symbols_and_adjacent_part_numbers(input.splitlines())
 
         # Sum the gear ratios which are all the gear symbols `*` with exactly
         # two part numbers.
@@ -1,24 +1,37 @@
 from dataclasses import dataclass
-from advent.utils import find_ints, split
 from donner.annotations import example, solver
 from donner.solution import AbstractSolver
 import logging
 
 
-@dataclass
+@dataclass(slots=True)
 class Card:
-    winning_numbers: list[int]
-    my_numbers: list[int]
+    # Bit `n` of each mask is set when `n` is in the card's list of numbers.
+    winning_mask: int
+    my_mask: int
 
+    def num_matches(self) -> int:
+        """Returns how many of my numbers are also winning numbers."""
+        return (self.winning_mask & self.my_mask).bit_count()
 
-def parse_card(text: str) -> Card:
-    _, numbers_text = split(text, ":")
-    winning_numbers_text, my_numbers_text = split(numbers_text, "|")
 
-    winning_numbers = find_ints(winning_numbers_text)
-    my_numbers = find_ints(my_numbers_text)
+def numbers_to_mask(text: str) -> int:
+    """Returns a bitmask with bit `n` set for every number `n` in `text`."""
+    mask = 0
+
+    for x in text.split():
+        mask |= 1 << int(x)
+
+    return mask
+
 
-    return Card(winning_numbers, my_numbers)
+def parse_card(text: str) -> Card:
+    _, _, numbers_text = text.partition(":")
+    winning_numbers_text, _, my_numbers_text = numbers_text.partition("|")
+
+    # The numbers are all small positive values, so each list of numbers can be
+    # stored as a bitmask and matched with a single AND.
+    return Card(numbers_to_mask(winning_numbers_text), numbers_to_mask(my_numbers_text))
 
 
 @solver(day=4, year=2023, name="Scratchcards")
@@ -41,45 +54,41 @@ class Day4Solver(AbstractSolver):
 
         for card_line_text in input.splitlines():
             # Count the number of matches for this card.
-            card = parse_card(card_line_text)
-            num_matches = 0
-
-            for x in card.my_numbers:
-                if x in card.winning_numbers:
-                    num_matches += 1
+            num_matches = parse_card(card_line_text).num_matches()
 
             # Sum the match score of each card.
             if num_matches > 0:
-                sum += 2 ** (num_matches - 1)
+                sum += 1 << (num_matches - 1)
 
         return sum
 
     def part_two(self, input: str) -> int | str | None:
-        # Tally the cards.
-        cards: list[Card] = [parse_card(line) for line in input.splitlines()]
-        count: list[int] = [1 for _ in cards]
+        # Count the number of matches for each card up front, then tally the
+        # copies won in a single forward pass over plain integer lists.
+        matches = [parse_card(line).num_matches() for line in input.splitlines()]
+        count: list[int] = [1] * len(matches)
+        debug = logging.getLogger().isEnabledFor(logging.DEBUG)
 
-        for index, card in enumerate(cards):
-            # Count the number of matches for this card.
-            num_matches = 0
-
-            for x in card.my_numbers:
-                if x in card.winning_numbers:
-                    num_matches += 1
+        for index, num_matches in enumerate(matches):
+            copies = count[index]
 
             # Generate new card copies based on the number of matches.
-            logging.debug(
-                f"card {index + 1} with {count[index]} copies had {num_matches} matches and will award {count[index]} copies"
-            )
-
-            for x in range(index + 1, min(index + num_matches + 1, len(count))):
-                count[x] += count[index]
+            if debug:
                 logging.debug(
-                    f" -> card {x + 1} will receive {count[index]} for new total of {count[x]}"
+                    f"card {index + 1} with {copies} copies had {num_matches} matches and will award {copies} copies"
                 )
 
+            for x in range(index + 1, min(index + num_matches + 1, len(count))):
+                count[x] += copies
+
+                if debug:
+                    logging.debug(
+                        f" -> card {x + 1} will receive {copies} for new total of {count[x]}"
+                    )
+
         # Show the final card counts.
-        for index, c in enumerate(count):
-            logging.info(f"game {index + 1} had {c} copies")
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            for index, c in enumerate(count):
+                logging.info(f"game {index + 1} had {c} copies")
 
         return sum(count)
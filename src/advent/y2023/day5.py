@@ -1,61 +1,122 @@
-from dataclasses import dataclass
-from advent.utils import Range, find_ints, merge_ranges, not_none, split
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from advent.utils import Range, merge_ranges
 from donner.annotations import example, solver
 from donner.solution import AbstractSolver
 
 
-@dataclass
+@dataclass(slots=True)
 class Map:
+    """
+    Maps values from one category to another. Each source range is stored as
+    an entry in three parallel lists sorted by the start of the source range.
+    """
+
     name: str
-    ranges: list[tuple[Range, Range]]  # [(source, dest)]
+    source_starts: list[int] = field(default_factory=list)
+    source_ends: list[int] = field(default_factory=list)
+    deltas: list[int] = field(default_factory=list)  # dest start - source start
 
     def add(self, source: Range, dest: Range):
-        def key(v: tuple[Range, Range]):
-            return v[0].start
+        i = bisect_right(self.source_starts, source.start)
 
-        self.ranges.append((source, dest))
-        self.ranges.sort(key=key)
+        self.source_starts.insert(i, source.start)
+        self.source_ends.insert(i, source.start + source.length)
+        self.deltas.insert(i, dest.start - source.start)
 
     def apply(self, value: int) -> int:
-        for source, dest in self.ranges:
-            if value in source:
-                delta = dest.start - source.start
-                return value + delta
+        # The ranges are sorted by source start, so the only source range that
+        # can hold `value` is the last one that starts at or before it.
+        i = bisect_right(self.source_starts, value) - 1
 
-        return value
+        if i >= 0 and value < self.source_ends[i]:
+            return value + self.deltas[i]
 
+        return value
 
-@dataclass
+    def apply_ranges(self, ranges: list[Range]) -> list[Range]:
+        """
+        Applies this map to every value in `ranges`, and returns the resulting
+        ranges merged and sorted by starting value.
+        """
+        source_starts = self.source_starts
+        source_ends = self.source_ends
+        deltas = self.deltas
+        mapped_ranges: list[Range] = []
+
+        for r in ranges:
+            # Walk the unmapped values [start, end) through the source ranges
+            # from left to right. Begin at the last source range that starts at
+            # or before `start` because it might cover the front of the range.
+            start = r.start
+            end = r.start + r.length
+            i = max(bisect_right(source_starts, start) - 1, 0)
+
+            while start < end and i < len(source_starts):
+                if source_ends[i] <= start:
+                    i += 1
+                    continue
+                elif source_starts[i] >= end:
+                    break
+
+                # Any values before this source range will never be mapped
+                # (because the source ranges are sorted) so just add them to
+                # the output.
+                if start < source_starts[i]:
+                    mapped_ranges.append(Range(start, source_starts[i] - start))
+                    start = source_starts[i]
+
+                # The part inside the source range is added to the output after
+                # applying the src -> dest mapping.
+                inner_end = min(end, source_ends[i])
+                mapped_ranges.append(Range(start + deltas[i], inner_end - start))
+
+                start = inner_end
+                i += 1
+
+            # Anything left over after the last source range is unmapped.
+            if start < end:
+                mapped_ranges.append(Range(start, end - start))
+
+        # Merge the ranges as an optimization step before moving to the next
+        # map round.
+        return merge_ranges(mapped_ranges)
+
+
+@dataclass(slots=True)
 class Almanac:
     seeds: list[int]
     maps: list[Map]
 
 
 def parse_almanac(almanac_text: str) -> Almanac:
-    lines = almanac_text.splitlines()
-    seeds_line = lines[0]
-    map_lines = lines[2:]
+    # Sections are separated by blank lines. The first section lists the seeds,
+    # and every other section is a "X-to-Y map:" header followed by one range
+    # per line. Line endings are normalized first so CRLF input still has blank
+    # lines to split on.
+    almanac_text = "\n".join(almanac_text.splitlines())
+    seeds_section, *map_sections = almanac_text.split("\n\n")
 
     # Parse the seeds
-    _, seeds_list_text = split(seeds_line, ":")
-    seeds = find_ints(seeds_list_text)
+    _, _, seeds_list_text = seeds_section.partition(":")
+    seeds = [int(x) for x in seeds_list_text.split()]
 
     # Parse each X to Y map section.
     maps: list[Map] = []
 
-    for line in map_lines:
-        if len(line) == 0:
+    for section in map_sections:
+        if not section.strip():
             continue
 
-        if line.endswith("map:"):
-            name, _ = split(line, " ")
-            maps.append(Map(name, []))
-        else:
-            range_parts = find_ints(line)
-            dest = Range(start=range_parts[0], length=range_parts[2])
-            source = Range(start=range_parts[1], length=(range_parts[2]))
+        header, *range_lines = section.strip().splitlines()
+        maps.append(Map(header.split()[0]))
 
-            maps[-1].add(source=source, dest=dest)
+        for line in range_lines:
+            dest_start, source_start, length = [int(x) for x in line.split()]
+            maps[-1].add(
+                source=Range(start=source_start, length=length),
+                dest=Range(start=dest_start, length=length),
+            )
 
     return Almanac(seeds=seeds, maps=maps)
 
@@ -100,87 +161,42 @@ def parse_almanac(almanac_text: str) -> Almanac:
     part_one="35",
     part_two="46",
 )
+@example(
+    input="seeds: 1 5\r\n\r\nseed-to-soil map:\r\n10 1 2\r\n\r\n"
+    "soil-to-fertilizer map:\r\n0 10 1\r\n",
+    part_one="0",
+    part_two="0",
+)
 class Day5Solver(AbstractSolver):
     def part_one(self, input: str) -> int | str | None:
         almanac = parse_almanac(input)
-        locations: list[int] = []
-
-        for i in range(0, len(almanac.seeds)):
-            v = almanac.seeds[i]
 
-            for map in almanac.maps:
-                v = map.apply(v)
+        # Transform all of the seeds through one map at a time rather than each
+        # seed through every map.
+        values = almanac.seeds
 
-            locations.append(v)
+        for map in almanac.maps:
+            apply = map.apply
+            values = [apply(v) for v in values]
 
-        return min(locations)
+        return min(values)
 
     def part_two(self, input: str) -> int | str | None:
         almanac = parse_almanac(input)
 
-        # Transform each "seed range" in the input to the final location range.
-        # Convert the "seeds" in the input to seed ranges.
-        location_ranges: list[Range] = []
-
-        for seed_i in range(0, len(almanac.seeds), 2):
-            seed_range = Range(almanac.seeds[seed_i], length=almanac.seeds[seed_i + 1])
-            ranges_to_map = [seed_range]
-            mapped_ranges = []
-
-            # Iterate through each transform in the map for the seed input range.
-            for map in almanac.maps:
-                mapped_ranges.clear()
-
-                # Iterate through each range that hasn't been transformed yet in
-                # this map round.
-                for r in ranges_to_map:
-                    next_r = r
-
-                    # Iterate through each src -> dest pair in the current map.
-                    # Note that this list is ordered meaning every following src
-                    # is larger than the previous.
-                    for src, dest in map.ranges:
-                        if next_r is None:
-                            break
-
-                        # If the [src, src+len] range overlaps the unmapped
-                        # range then split it up.
-                        #
-                        # Any range preceding `src` will never be mapped (because
-                        # it is sorted) so just add it to the output.
-                        #
-                        # The inner range (second tuple member) is added to the
-                        # output after applying the src -> dest mapping.
-                        #
-                        # The range after `src` might still have a future src
-                        # that will apply. Copy it to `next_r` and process it
-                        # next before moving on.
-                        if next_r.overlaps(src):
-                            before, inner, after = not_none(next_r.split(src))
-                            next_r = after
-
-                            if before is not None:
-                                mapped_ranges.append(before)
-
-                            # Apply the src -> dest mapping.
-                            delta = dest.start - src.start
-                            inner.start += delta
-
-                            mapped_ranges.append(inner)
-
-                    # After all the src ranges are checked we can consider any
-                    # remaining chunk to be unmapped. Copy it to the output
-                    # bucket.
-                    if next_r is not None:
-                        mapped_ranges.append(next_r)
-
-                # Merge the ranges as an optimization step before moving to the
-                # next map round.
-                merge_ranges(mapped_ranges)
-                ranges_to_map = list(mapped_ranges)
-
-            # Finished iterating through all of the map transforms for this
-            # seed range.
-            location_ranges += mapped_ranges
-
-        return min(location_ranges, key=lambda x: x.start).start
+        # Convert the "seeds" in the input to seed ranges, and then transform
+        # all of the seed ranges together through each map to get the final
+        # location ranges. Overlapping ranges are merged after every map so
+        # the number of ranges stays small.
+        ranges = merge_ranges(
+            [
+                Range(almanac.seeds[seed_i], length=almanac.seeds[seed_i + 1])
+                for seed_i in range(0, len(almanac.seeds), 2)
+            ]
+        )
+
+        for map in almanac.maps:
+            ranges = map.apply_ranges(ranges)
+
+        # The merged ranges are sorted by starting value.
+        return ranges[0].start
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from advent.utils import find_ints, find_digits, digits_to_int
+from advent.utils import find_ints
 from donner.annotations import example, solver
 from donner.solution import AbstractSolver
 import logging
@@ -32,8 +32,10 @@ def parse_race_sheet_single(input: str) -> Race:
     assert lines[0].startswith("Time:")
     assert lines[1].startswith("Distance:")
 
-    time = digits_to_int(find_digits(lines[0]))
-    distance = digits_to_int(find_digits(lines[1]))
+    # Ignore the spaces between numbers by joining every digit on the line
+    # into one string, and then parse it as a single integer.
+    time = int("".join(filter(str.isdigit, lines[0])))
+    distance = int("".join(filter(str.isdigit, lines[1])))
 
     return Race(time=time, distance_record=distance)
 
@@ -66,24 +68,34 @@ def count_ways_to_win(time: int, distance_record: int) -> int:
 
     if discriminant < 0:
         raise Exception(f"no solution for time={time}, dist={distance_record}")
-    else:
-        min_time_to_hold = (time - math.sqrt(discriminant)) / 2
-        max_time_to_hold = (time + math.sqrt(discriminant)) / 2
-
-        logging.debug(
-            f"min = {min_time_to_hold}, max = {max_time_to_hold}, t = {time}, s = {distance_record}, d = {discriminant}"
-        )
-
-        # There is a weird edge case here when when the roots (min, max time)
-        # are both integers. This edge arises because you have to _beat_ the
-        # record not just match it, so `>=` rather than `=`.
-        #
-        # A simpler fix than checking for the integer case is to flip the floor
-        # and ceil around, and subtract rather than add one.
-        #
-        # See:
-        # https://www.reddit.com/r/adventofcode/comments/18c08xh/2023_day_06_stable_math_solution/
-        return int(math.ceil(max_time_to_hold) - math.floor(min_time_to_hold) - 1)
+
+    # Solve with an integer square root so the answer stays exact no matter how
+    # large the input is, rather than relying on float rounding at the roots.
+    #
+    # Start just below the smaller root and step forward to the first hold
+    # time that _beats_ the record (matching it is not enough). Holding the
+    # button is symmetric around t / 2, so the last winning hold time mirrors
+    # the first one.
+    min_time_to_hold = max((time - math.isqrt(discriminant)) // 2 - 1, 0)
+
+    while min_time_to_hold * (time - min_time_to_hold) <= distance_record:
+        min_time_to_hold += 1
+
+        if min_time_to_hold > time // 2:
+            return 0
+
+    max_time_to_hold = time - min_time_to_hold
+
+    logging.debug(
+        "min = %d, max = %d, t = %d, s = %d, d = %d",
+        min_time_to_hold,
+        max_time_to_hold,
+        time,
+        distance_record,
+        discriminant,
+    )
+
+    return max_time_to_hold - min_time_to_hold + 1
 
 
 @solver(day=6, year=2023, name="Wait For It")
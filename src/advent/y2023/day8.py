@@ -9,6 +9,8 @@ from advent.utils import not_none
 
 MAX_STEPS = 100000
 
+_NODE_RE = re.compile(r"^(\w+) = \((\w+), (\w+)\)$")
+
 
 @dataclass
 class Node:
@@ -50,7 +52,7 @@ class Map:
         network: dict[str, Node] = {}
 
         for line in lines[2:]:
-            m = not_none(re.match(r"^(\w+) = \((\w+), (\w+)\)$", line))
+            m = not_none(_NODE_RE.match(line))
 
             node_name = m.group(1)
             left_name = m.group(2)
@@ -140,7 +142,7 @@ class Day8Solver(AbstractSolver):
         start_nodes = [n for n in map.network.values() if n.is_start()]
         path_lengths = [path_length(map, n.name) for n in start_nodes]
 
-        logging.debug(f"{map.network}")
+        logging.debug("%s", map.network)
 
         for start_node, plen in zip(start_nodes, path_lengths):
             logging.info(f"{start_node} length = {plen}")
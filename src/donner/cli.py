@@ -7,15 +7,20 @@ from donner.client import (
 from donner.data import (
     FileBackedPuzzleStore,
 )
+from donner.plugins import enumerate_solution_plugins
 from donner.solution import (
     Part,
     SolverMetadata,
     get_global_solver_registry,
 )
+from collections.abc import Callable
 from pathlib import Path
 
 import argparse
+import copy
 import cryptography.fernet
+import functools
+import itertools
 import logging
 import os
 import shutil
@@ -160,6 +165,13 @@ def create_aoc_client() -> AocWebClient | None:
     return AocWebClient(AocClientConfig.load_from_file(".aoc_config"))
 
 
+@functools.lru_cache(maxsize=4)
+def _get_store(data_dir: Path, password: str) -> FileBackedPuzzleStore:
+    """Returns a puzzle store for `data_dir` that is shared by every command in
+    this process, so puzzles loaded by one command are not read again."""
+    return FileBackedPuzzleStore(data_dir, password=password)
+
+
 class AdventUserException(Exception):
     def __init__(self, *args: object) -> None:
         super().__init__(*args)
@@ -168,7 +180,7 @@ class AdventUserException(Exception):
 class AdventSolutionMissing(AdventUserException):
     def __init__(self, year: int, day: int) -> None:
         super().__init__(
-            f"🔍 There is no code implementing a solution for year {year} day {day} (expected file `advent/solutions/y{year}/day{day}.py`)",
+            f"🔍 There is no code implementing a solution for year {year} day {day} (expected file `advent/y{year}/day{day}.py`)",
         )
 
 
@@ -183,6 +195,7 @@ def solve(
     part: Part | None = None,
     example_index: int | None = None,
     input: str | None = None,
+    parallel: bool = False,
 ):
     #
     aoc_client = create_aoc_client()
@@ -193,14 +206,14 @@ def solve(
     # Get a list of available solver classes, and create the requested solver.
     # If there is no solver for the requested day then print an error and return
     # to the caller.
-    registry = get_global_solver_registry()
+    solver_metadata = get_global_solver_registry().try_find_solver_for(year, day)
 
-    if not registry.has_solver_for(year, day):
+    if solver_metadata is None:
         raise AdventSolutionMissing(year, day)
 
     # Check if the puzzle input is cached on disk. If the input for this puzzle
     # are missing then load the inputs from the network.
-    store = FileBackedPuzzleStore(Path("data"), password=aoc_client.config.password)
+    store = _get_store(Path("data"), aoc_client.config.password)
 
     if not store.has_day(year, day) and not input:
         logger.debug("puzzle data is missing for year {year} day {day}")
@@ -215,27 +228,61 @@ def solve(
 
     puzzle = store.get(year, day)
 
-    #
+    # Snapshot the answer caches so changes made while running the solver can
+    # be detected without reloading the puzzle from the store.
+    og_answers = copy.deepcopy((puzzle.part_one_answer, puzzle.part_two_answer))
+
     run_solver(
-        solver_metadata=registry.find_solver_for(year, day),
+        solver_metadata=solver_metadata,
         puzzle=puzzle,
         client=aoc_client,
         events=TerminalSolverEventHandlers(),
         part=part,
         example_index=example_index,
         input=input,
+        parallel=parallel,
     )
 
     # Check if the puzzle answers were modified. If so then persist the new
     # puzzle data to disk.
-    og_puzzle = store.get(year, day)
-
-    if puzzle != og_puzzle:
+    if (puzzle.part_one_answer, puzzle.part_two_answer) != og_answers:
         # TODO: log
         store.set(year, day, puzzle)
 
 
-def cli_main():
+def prefetch_inputs(year: int, days: list[int]):
+    """Fetches the puzzle inputs for any of `days` that have a solver but are
+    missing from the puzzle store. The inputs are requested together so they
+    share one pooled HTTP session rather than one connection per day."""
+    aoc_client = create_aoc_client()
+
+    if aoc_client is None:
+        return
+
+    registry = get_global_solver_registry()
+    store = _get_store(Path("data"), aoc_client.config.password)
+    missing = [
+        (year, day)
+        for day in days
+        if registry.has_solver_for(year, day) and not store.has_day(year, day)
+    ]
+
+    if len(missing) > 0:
+        with aoc_client:
+            inputs = aoc_client.fetch_inputs_for(missing)
+
+        for (missing_year, missing_day), input in inputs.items():
+            store.add_day(missing_year, missing_day, input)
+
+        logger.info(f"puzzle inputs for {missing} have been loaded and cached")
+
+
+def cli_main(load_solutions: Callable[[int, list[int]], None] | None = None):
+    """Runs the command line interface. `load_solutions` is called to import
+    and register the solvers only when a subcommand needs them, so commands
+    like `--help` do not pay for importing every solution. It is passed the
+    year being solved and the requested days, where an empty list means every
+    day of that year."""
     parser = init_argparser()
     args = parser.parse_args()
 
@@ -250,12 +297,34 @@ def cli_main():
 
     try:
         if args.subparser_name == "solve":
+            # Default to the latest year with a solution for any day. The
+            # solution plugins are found without importing them, so only the
+            # requested days of that year are loaded.
             year = args.year
+
+            if year is None:
+                year = max(
+                    itertools.chain(
+                        registry.all_years(),
+                        (p.year for p in enumerate_solution_plugins()),
+                    ),
+                    default=None,
+                )
+
+            if year is None:
+                raise AdventUserException("🔍 There are no puzzle solutions to run")
+
+            if load_solutions is not None:
+                load_solutions(year, args.days)
+
             days = args.days if len(args.days) > 0 else registry.all_days(year)
             part = None if args.part is None else Part(args.part)
             example_index = None if args.example is None else int(args.example)
             input = None if args.input is None else args.input
 
+            if input is None:
+                prefetch_inputs(year, days)
+
             for day in days:
                 solve(
                     year=year,
@@ -263,6 +332,7 @@ def cli_main():
                     part=part,
                     example_index=example_index,
                     input=input,
+                    parallel=args.parallel,
                 )
         else:
             parser.print_help(sys.stderr)
@@ -285,7 +355,10 @@ def cli_main():
         print("")
 
 
+@functools.lru_cache(maxsize=1)
 def init_argparser() -> argparse.ArgumentParser:
+    """Returns the command line parser. The parser is built once and reused by
+    later calls to `cli_main`."""
     parser = argparse.ArgumentParser()
 
     # Global arguments.
@@ -328,8 +401,7 @@ def add_runner_args(parser: argparse.ArgumentParser):
         "-y",
         "--year",
         type=int,
-        default=max(get_global_solver_registry().all_years()),
-        help="the puzzle year",
+        help="the puzzle year (defaults to the latest year with a solution)",
     )
     parser.add_argument(
         "-p",
@@ -347,3 +419,8 @@ def add_runner_args(parser: argparse.ArgumentParser):
     parser.add_argument(
         "-i", "--input", type=str, help="custom input string for the puzzle"
     )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="run the examples and both parts at the same time in separate processes",
+    )
@@ -1,14 +1,23 @@
 from abc import ABC, abstractmethod
-from bs4 import BeautifulSoup
 from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING
 
+import concurrent.futures
+import datetime
 import logging
 import os
 import re
-import requests
+import tempfile
 
 from donner.solution import Part
 
+# `requests` is slow to import and is only needed once a request is made, so it
+# is imported when `AocWebClient` creates its session.
+if TYPE_CHECKING:
+    import requests
+    import urllib3.util.retry
+
 
 logger = logging.getLogger(__name__)
 
@@ -34,11 +43,12 @@ class SubmitResponse(Enum):
 
     def is_wrong(self):
         """Returns true if the response indicates the answer was incorrect."""
-        return (
-            self == SubmitResponse.Wrong
-            or self == SubmitResponse.TooLow
-            or self == SubmitResponse.TooHigh
-        )
+        return self in _WRONG_SUBMIT_RESPONSES
+
+
+_WRONG_SUBMIT_RESPONSES = frozenset(
+    {SubmitResponse.Wrong, SubmitResponse.TooLow, SubmitResponse.TooHigh}
+)
 
 
 class ClientException(Exception):
@@ -94,16 +104,45 @@ class UnknownPostAnswerError(ClientException):
         )
 
 
-def parse_http_response(response: requests.Response) -> str:
+def parse_http_response(response: "requests.Response") -> str:
     if response.status_code == _AOC_HTTP_INVALID_SESSION:
         raise InvalidSession()
     elif response.status_code == _AOC_HTTP_NOT_FOUND:
         raise ResourceNotFound()
     elif response.status_code > 400:
         raise HttpError(response.status_code)
+
+    # Advent of Code always serves UTF-8. Setting the encoding explicitly skips
+    # the charset detection that `requests` otherwise runs over the whole body.
+    response.encoding = "utf-8"
     return response.text.strip()
 
 
+# Identifies this tool to the Advent of Code website as requested by its
+# automation guidelines. Sent once per session rather than with each request.
+_USER_AGENT = "github.com/smacdo/advent [email: dev@smacdo.com]"
+
+# The maximum number of requests that `AocWebClient` will have in flight at
+# once. This must not exceed the session's connection pool size.
+_MAX_CONCURRENT_REQUESTS = 8
+
+
+# Transient server errors are retried with exponential backoff by the session's
+# connection pool rather than failing the request. Other errors (eg an invalid
+# session id) are not retried and are handled by `parse_http_response`. Only
+# GET requests are retried because submitting an answer is not idempotent.
+def _retry_policy() -> "urllib3.util.retry.Retry":
+    import urllib3.util.retry
+
+    return urllib3.util.retry.Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=["GET"],
+        raise_on_status=False,
+    )
+
+
 class AocClientConfig:
     """Stores a username and Advent of Code session id used by the Advent of Code
     client class."""
@@ -132,10 +171,14 @@ class AocClientConfig:
         for line in file_text.splitlines():
             line = line.strip()
 
-            if line == "" or line.startswith("#"):
+            if not line or line[0] == "#":
                 continue
 
-            name, value = line.split("=", maxsplit=1)
+            name, sep, value = line.partition("=")
+
+            if not sep:
+                logger.info(f"ignoring config line without a value `{line}`")
+                continue
 
             name = name.strip()
             value = value.strip()
@@ -158,11 +201,77 @@ class AocClientConfig:
 
     @staticmethod
     def load_from_file(file_name: str = ".aoc_login") -> "AocClientConfig":
-        """Tries to load the login configuration from the provided file path"""
-        with open(file_name, "r") as file:
-            return AocClientConfig.load_from_str(
-                file.read(), config_path=os.path.abspath(file_name)
-            )
+        """Tries to load the login configuration from the provided file path.
+
+        Loaded configs are cached by path along with the file's modification
+        time, so loading an unchanged file more than once will skip reading and
+        parsing it."""
+        config_path = os.path.abspath(file_name)
+        mtime = os.stat(config_path).st_mtime_ns
+        cached = _config_cache.get(config_path)
+
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with open(config_path, "r") as file:
+            config = AocClientConfig.load_from_str(file.read(), config_path=config_path)
+
+        _config_cache[config_path] = (mtime, config)
+        return config
+
+
+_config_cache: dict[str, tuple[int, AocClientConfig]] = {}
+
+
+class DiskCache:
+    """Stores text values on disk as individual files in a cache directory.
+
+    Keys are relative paths (eg `y2022/calendar.html`) beneath `cache_dir`.
+    Values are written atomically so a partially written file is never read
+    back as a cache hit.
+    """
+
+    cache_dir: Path
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+
+    def get(self, key: str) -> str | None:
+        """Returns the value stored for `key` or `None` if it is not cached."""
+        try:
+            return (self.cache_dir / key).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, value: str) -> None:
+        """Stores `value` for `key`, replacing any previously cached value."""
+        path = self.cache_dir / key
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(dir=path.parent)
+
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(value)
+
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def remove(self, key: str) -> None:
+        """Removes the value stored for `key` if it is cached."""
+        (self.cache_dir / key).unlink(missing_ok=True)
+
+
+def default_cache_dir() -> Path:
+    """Returns the per-user directory used to cache Advent of Code data."""
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+
+    if xdg_cache_home:
+        return Path(xdg_cache_home) / "advent"
+    else:
+        return Path.home() / ".cache" / "advent"
 
 
 class AocDay:
@@ -181,13 +290,84 @@ class AocDay:
         self.part_one_solved = part_one_solved
         self.part_two_solved = part_two_solved
 
+    # Star suffix indexed by `(part_two_solved << 1) | part_one_solved`.
+    _SUFFIX = ("", "*", "**", "**")
+
     def __str__(self) -> str:
-        if self.part_two_solved:
-            return f"{self.day}**"
-        elif self.part_one_solved:
-            return f"{self.day}*"
-        else:
-            return f"{self.day}"
+        stars = (self.part_two_solved << 1) | self.part_one_solved
+        return f"{self.day}{self._SUFFIX[stars]}"
+
+
+# Matches the link to each unlocked puzzle on a year's calendar page, and
+# captures the link's attributes. A typical link looks like:
+#   <a aria-label="Day 1, two stars" href="/2023/day/1" class="calendar-day1">
+_CALENDAR_LINK_RE = re.compile(r'<a\s([^>]*\bhref="/\d+/day/\d+"[^>]*)>')
+_CALENDAR_DAY_RE = re.compile(r'\bhref="/\d+/day/(\d+)"')
+_CALENDAR_LABEL_RE = re.compile(r'\baria-label="([^"]*)"')
+
+
+def parse_calendar_days(year: int, page: str) -> list[AocDay]:
+    """Parses the HTML calendar page for `year` and returns the unlocked days
+    sorted by day along with how many parts of each day were solved."""
+    days = []
+
+    for link in _CALENDAR_LINK_RE.finditer(page):
+        attributes = link[1]
+        day = int(_CALENDAR_DAY_RE.search(attributes)[1])  # type: ignore
+
+        label = _CALENDAR_LABEL_RE.search(attributes)
+        label_text = label[1] if label is not None else ""
+
+        part_two_solved = "two stars" in label_text
+        part_one_solved = part_two_solved or "one star" in label_text
+
+        days.append(
+            AocDay(
+                year=year,
+                day=day,
+                part_one_solved=part_one_solved,
+                part_two_solved=part_two_solved,
+            )
+        )
+
+    days.sort(key=lambda x: x.day)
+    return days
+
+
+# Phrases in the answer submission response page and the response that each
+# phrase indicates. The table is checked in order, so a phrase must be listed
+# before any shorter phrase it contains ("not the right answer" before "the
+# right answer").
+_SUBMIT_RESPONSE_PHRASES = (
+    ("answer is too low", SubmitResponse.TooLow),
+    ("answer is too high", SubmitResponse.TooHigh),
+    ("not the right answer", SubmitResponse.Wrong),
+    ("the right answer", SubmitResponse.Ok),
+    ("gave an answer too recently", SubmitResponse.TooSoon),
+    ("already complete it", SubmitResponse.AlreadyAnswered),
+)
+
+
+def parse_submit_response(page: str) -> SubmitResponse:
+    """Parses the HTML page returned after submitting an answer, and returns
+    the response it contains."""
+    # BeautifulSoup is slow to import and only needed when submitting answers.
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    # Only the `<article>` element holds the response message so the rest of
+    # the page is skipped rather than built into the parse tree.
+    soup = BeautifulSoup(page, "html.parser", parse_only=SoupStrainer("article"))
+    article_elem = soup.find("article")
+
+    if article_elem is not None:
+        for message in article_elem.stripped_strings:
+            message = message.lower()
+
+            for phrase, response in _SUBMIT_RESPONSE_PHRASES:
+                if phrase in message:
+                    return response
+
+    raise UnknownPostAnswerError(page)
 
 
 class AocClient(ABC):
@@ -197,6 +377,12 @@ class AocClient(ABC):
     def fetch_input_for(self, year: int, day: int) -> str:
         pass
 
+    def fetch_inputs_for(
+        self, puzzles: list[tuple[int, int]]
+    ) -> dict[tuple[int, int], str]:
+        """Returns the input data for each `(year, day)` pair in `puzzles`."""
+        return {(year, day): self.fetch_input_for(year, day) for year, day in puzzles}
+
     @abstractmethod
     def fetch_days(self, year: int) -> list[AocDay]:
         pass
@@ -212,51 +398,96 @@ class AocWebClient(AocClient):
     """Interacts with the Advent of Code website."""
 
     config: AocClientConfig
+    cache: DiskCache
+    _session: "requests.Session | None"
 
-    def __init__(self, config: AocClientConfig):
+    def __init__(self, config: AocClientConfig, cache_dir: Path | None = None):
         self.config = config
-        self.headers = {
-            "Cookie": f"session={config.session_id}",
-            "user-agent": "github.com/smacdo/advent [email: dev@smacdo.com]",
-        }
+        self.cache = DiskCache(
+            cache_dir if cache_dir is not None else default_cache_dir()
+        )
+        self._session = None
+
+    @property
+    def session(self) -> "requests.Session":
+        """The HTTP session used for all requests. The session is created on
+        first use so constructing a client that never touches the network stays
+        cheap."""
+        if self._session is None:
+            import requests
+            import requests.adapters
+
+            # Share one session across all requests so the TCP and TLS
+            # connection to the Advent of Code website is kept alive and reused
+            # between calls.
+            session = requests.Session()
+            session.headers.update(
+                {
+                    "Cookie": f"session={self.config.session_id}",
+                    "user-agent": _USER_AGENT,
+                }
+            )
+            session.mount(
+                "https://",
+                requests.adapters.HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=20,
+                    max_retries=_retry_policy(),
+                ),
+            )
+            self._session = session
+
+        return self._session
+
+    def close(self) -> None:
+        """Closes any network connections held open by this client."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def __enter__(self) -> "AocWebClient":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
 
     def fetch_input_for(self, year: int, day: int) -> str:
         """Returns the input data for the given day and year. Input data is unique to each user and
         should not be stored in plaintext at the request of the Advent of Code creator."""
         url = f"https://adventofcode.com/{year}/day/{day}/input"
-        return parse_http_response(requests.get(url, headers=self.headers))
+        return parse_http_response(self.session.get(url))
+
+    def fetch_inputs_for(
+        self, puzzles: list[tuple[int, int]]
+    ) -> dict[tuple[int, int], str]:
+        """Returns the input data for each `(year, day)` pair in `puzzles`. The
+        inputs are requested concurrently over the client's pooled session."""
+        # Create the session before starting workers so they all share it.
+        self.session
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=_MAX_CONCURRENT_REQUESTS
+        ) as executor:
+            inputs = executor.map(lambda p: self.fetch_input_for(*p), puzzles)
+            return dict(zip(puzzles, inputs))
 
     def fetch_days(self, year: int) -> list[AocDay]:
         """Fetches a list of available Advent of Code days for a given year along with information
         showing if each day was partially or fully completed."""
-        url = f"https://adventofcode.com/{year}/"
-        page = parse_http_response(requests.get(url, headers=self.headers))
-        soup = BeautifulSoup(page, "html.parser")
-        days = []
-
-        for element in soup.find(class_="calendar").fincd_all("a"):  # type: ignore
-            result = re.search("(\\d+)$", element["href"])
-            day = int(result[1])  # type: ignore
+        # The calendar for a past year only changes when an answer is submitted
+        # so it is cached on disk until then. The current year is always
+        # fetched because new puzzles are unlocked each day.
+        cache_key = _calendar_cache_key(year)
+        page = self.cache.get(cache_key) if year < _current_year() else None
 
-            part_one_solved = (
-                True if element["aria-label"].find("one star") != -1 else False
-            )
+        if page is None:
+            url = f"https://adventofcode.com/{year}/"
+            page = parse_http_response(self.session.get(url))
 
-            part_two_solved = (
-                True if element["aria-label"].find("two star") != -1 else False
-            )
+            if year < _current_year():
+                self.cache.put(cache_key, page)
 
-            days.append(
-                AocDay(
-                    year=year,
-                    day=day,
-                    part_one_solved=part_one_solved,
-                    part_two_solved=part_two_solved,
-                )
-            )
-
-        days.sort(key=lambda x: x.day)
-        return days
+        return parse_calendar_days(year, page)
 
     def submit_answer(
         self, year: int, day: int, part: Part, answer: str
@@ -266,32 +497,22 @@ class AocWebClient(AocClient):
         if self.config.pretend_submit:
             raise ClientException("cannot submit answer if `pretend_submit` = False!")
 
+        # Submitting an answer can change the stars shown on the calendar.
+        self.cache.remove(_calendar_cache_key(year))
+
         page = parse_http_response(
-            requests.post(
+            self.session.post(
                 f"https://adventofcode.com/{year}/day/{day}/answer",
                 data={"level": "1" if part == Part.One else "2", "answer": answer},
-                headers=self.headers,
             )
         )
 
-        soup = BeautifulSoup(page, "html.parser")
-        article_elem = soup.find("article")
-
-        if article_elem is not None:
-            for message in article_elem.stripped_strings:
-                message = message.lower()
-
-                if "the right answer" in message:
-                    return SubmitResponse.Ok
-                elif "answer is too low" in message:
-                    return SubmitResponse.TooLow
-                elif "answer is too high" in message:
-                    return SubmitResponse.TooHigh
-                elif "not the right answer" in message:
-                    return SubmitResponse.Wrong
-                elif "gave an answer too recently" in message:
-                    return SubmitResponse.TooSoon
-                elif "already complete it" in message:
-                    return SubmitResponse.AlreadyAnswered
-
-        raise UnknownPostAnswerError(soup.prettify())
+        return parse_submit_response(page)
+
+
+def _calendar_cache_key(year: int) -> str:
+    return f"y{year}/calendar.html"
+
+
+def _current_year() -> int:
+    return datetime.date.today().year
@@ -1,12 +1,16 @@
 import base64
+import copy
+import functools
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
+from typing import Any
 
 from donner.solution import Part
 
@@ -27,14 +31,15 @@ class AnswerResponse(Enum):
         return self == AnswerResponse.Ok
 
     def is_wrong(self) -> bool:
-        return (
-            self == AnswerResponse.Wrong
-            or self == AnswerResponse.TooLow
-            or self == AnswerResponse.TooHigh
-        )
+        return self in _WRONG_ANSWER_RESPONSES
+
+
+_WRONG_ANSWER_RESPONSES = frozenset(
+    {AnswerResponse.Wrong, AnswerResponse.TooLow, AnswerResponse.TooHigh}
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class PartAnswerCache:
     """Stores correct and incorrect answers for either part one or part two of
     a question.
@@ -64,24 +69,29 @@ class PartAnswerCache:
     def check_answer(self, answer: str | int) -> AnswerResponse:
         """Check if the answer is known to be correct or incorrect. Answers that
         cannot be checked will be returned as `AnswerResponse.Unknown`."""
-        maybe_int = PartAnswerCache._cast_int(answer)
+        # Most checks are for a puzzle that was already solved, so test for the
+        # correct answer before parsing the answer for the boundary checks.
+        answer_str = str(answer)
 
-        if maybe_int is not None:
-            if self.low_boundary is not None and maybe_int <= self.low_boundary:
-                return AnswerResponse.TooLow
-            elif self.high_boundary is not None and maybe_int >= self.high_boundary:
-                return AnswerResponse.TooHigh
+        if answer_str == self.correct_answer:
+            return AnswerResponse.Ok
 
-        answer = str(answer)
+        # Only parse the answer as an integer if there is a boundary to check it
+        # against.
+        low_boundary = self.low_boundary
+        high_boundary = self.high_boundary
 
-        if answer in self.wrong_answers:
-            return AnswerResponse.Wrong
+        if low_boundary is not None or high_boundary is not None:
+            maybe_int = PartAnswerCache._cast_int(answer)
 
-        if self.correct_answer is not None:
-            if answer == self.correct_answer:
-                return AnswerResponse.Ok
-            else:
-                return AnswerResponse.Wrong
+            if maybe_int is not None:
+                if low_boundary is not None and maybe_int <= low_boundary:
+                    return AnswerResponse.TooLow
+                elif high_boundary is not None and maybe_int >= high_boundary:
+                    return AnswerResponse.TooHigh
+
+        if answer_str in self.wrong_answers or self.correct_answer is not None:
+            return AnswerResponse.Wrong
         else:
             return AnswerResponse.Unknown
 
@@ -128,8 +138,12 @@ class PartAnswerCache:
         if isinstance(s, int):
             return s
         elif isinstance(s, str) and (
-            s.isdigit() or (s.startswith("-") and s[1:].isdigit())
+            s.isascii() and (s.isdigit() or (s[:1] == "-" and s[1:].isdigit()))
         ):
+            # Only plain ASCII digits with an optional `-` are integer answers.
+            # `int` on its own would also accept surrounding whitespace, a `+`
+            # sign and `_` separators, and `isdigit` accepts digits like `³`
+            # that `int` cannot parse.
             return int(s)
         else:
             return None
@@ -140,29 +154,32 @@ class PartAnswerCache:
         """
 
         # Answers cannot have a newline!
-        if self.correct_answer is not None and self.correct_answer.find("\n") != -1:
+        if self.correct_answer is not None and "\n" in self.correct_answer:
             raise ValueError("cannot serialize a correct answer that has a newline")
 
-        for a in self.wrong_answers:
-            if a.find("\n") != -1:
-                raise ValueError("cannot serialize a wrong answer that has a newline")
+        # Generate formatted lines for attributes in this class. Wrong answers
+        # should be sorted so that are serialized in a stable order, and unlike
+        # the other attributes the last one is not followed by a newline.
+        parts: list[str] = []
 
-        # Generate formatted strings for attributes in this class.
-        # Wrong answers should be sorted so that are serialized in a stable order.
-        correct_str = (
-            f"= {self.correct_answer}\n" if self.correct_answer is not None else ""
-        )
-        low_bounds = f"[ {self.low_boundary}\n" if self.low_boundary is not None else ""
-        high_bounds = (
-            f"] {self.high_boundary}\n" if self.high_boundary is not None else ""
-        )
+        if self.correct_answer is not None:
+            parts.append(f"= {self.correct_answer}\n")
+
+        if self.low_boundary is not None:
+            parts.append(f"[ {self.low_boundary}\n")
 
-        sorted_wrong_answers = list(self.wrong_answers)
-        sorted_wrong_answers.sort()
+        if self.high_boundary is not None:
+            parts.append(f"] {self.high_boundary}\n")
 
-        wrong_answers = "\n".join([f"X {x}" for x in sorted_wrong_answers])
+        sorted_wrong_answers = sorted(self.wrong_answers)
 
-        return f"{correct_str}{low_bounds}{high_bounds}{wrong_answers}"
+        for a in sorted_wrong_answers:
+            if "\n" in a:
+                raise ValueError("cannot serialize a wrong answer that has a newline")
+
+        parts.append("\n".join(["X " + x for x in sorted_wrong_answers]))
+
+        return "".join(parts)
 
     @staticmethod
     def deserialize(text: str) -> "PartAnswerCache":
@@ -173,11 +190,7 @@ class PartAnswerCache:
         pac = PartAnswerCache()
 
         for line in text.splitlines():
-            ty, answer = line.split(" ", maxsplit=1)
-
-            if answer is None:
-                raise ValueError("answer was None or missing when deserializing")
-
+            ty, _, answer = line.partition(" ")
             answer = answer.strip()
 
             if answer == "":
@@ -185,39 +198,48 @@ class PartAnswerCache:
                     "answer was blank after stripping whitespace when deserializing"
                 )
 
-            if ty == "=":
-                pac.set_correct_answer(answer)
-            elif ty == "X":
-                pac.add_wrong_answer(answer)
-            elif ty == "[":
-                int_answer = PartAnswerCache._cast_int(answer)
+            action = _DESERIALIZE_ACTIONS.get(ty)
 
-                if int_answer is None:
-                    raise ValueError(
-                        "low boundary must be an integer when deserializing"
-                    )
-                else:
-                    pac.set_low_boundary(int_answer)
-            elif ty == "]":
+            if action is None:
+                raise ValueError(
+                    f"unknown or missing answer type `{ty}` when deserializing"
+                )
+
+            setter, int_field_name = action
+
+            if int_field_name is None:
+                setter(pac, answer)
+            else:
                 int_answer = PartAnswerCache._cast_int(answer)
 
                 if int_answer is None:
                     raise ValueError(
-                        "high boundary must be an integer when deserializing"
+                        f"{int_field_name} must be an integer when deserializing"
                     )
                 else:
-                    pac.set_high_boundary(int_answer)
-            else:
-                raise ValueError(
-                    f"unknown or missing answer type `{ty}` when deserializing"
-                )
+                    setter(pac, int_answer)
 
         return pac
 
 
+# Maps the type marker at the start of each serialized answer cache line to the
+# `PartAnswerCache` setter for that line, and the name of the field if the value
+# must be an integer.
+_DESERIALIZE_ACTIONS: dict[
+    str, tuple[Callable[[PartAnswerCache, Any], Any], str | None]
+] = {
+    "=": (PartAnswerCache.set_correct_answer, None),
+    "X": (PartAnswerCache.add_wrong_answer, None),
+    "[": (PartAnswerCache.set_low_boundary, "low boundary"),
+    "]": (PartAnswerCache.set_high_boundary, "high boundary"),
+}
+
+
 class PuzzleData:
     """Holds puzzle input and answer data."""
 
+    __slots__ = ("input", "part_one_answer", "part_two_answer")
+
     def __init__(
         self,
         input: str,
@@ -286,17 +308,66 @@ class FileBackedPuzzleStore(PuzzleStore):
 
     password: str
     repo_dir: Path
+    _puzzles: dict[tuple[int, int], tuple[tuple[int | None, ...], PuzzleData]]
+    _day_dirs: dict[tuple[int, int], Path]
 
     def __init__(self, data_dir: Path, password: str) -> None:
         self.password = password
         self.repo_dir = data_dir
+        self._puzzles = dict()
+        self._day_dirs = dict()
+
+    def _day_dir(self, year: int, day: int) -> Path:
+        """Returns the directory holding the puzzle files for a day. Paths are
+        built once per day and reused by later calls."""
+        day_dir = self._day_dirs.get((year, day))
+
+        if day_dir is None:
+            day_dir = self.repo_dir / f"y{year}" / str(day)
+            self._day_dirs[(year, day)] = day_dir
+
+        return day_dir
 
     def get(self, year: int, day: int) -> PuzzleData:
+        # Puzzles that were already read or written by this store are returned
+        # from memory instead of being read and decrypted again, unless one of
+        # the puzzle's files was modified since. Callers get a copy so changes
+        # are only stored when passed to `set`.
+        mtimes = self._field_mtimes(year, day)
+        cached = self._puzzles.get((year, day))
+
+        if cached is not None and cached[0] == mtimes:
+            puzzle = cached[1]
+        else:
+            puzzle = self._load(year, day)
+            self._puzzles[(year, day)] = (mtimes, puzzle)
+
+        return copy.deepcopy(puzzle)
+
+    def _field_mtimes(self, year: int, day: int) -> tuple[int | None, ...]:
+        """Returns the modification time of each of the puzzle's files, or
+        `None` for files that do not exist."""
+        day_dir = self._day_dir(year, day)
+        mtimes: list[int | None] = []
+
+        for field_file_name in (
+            INPUT_FILE_NAME,
+            PART_ONE_ANSWER_FILE_NAME,
+            PART_TWO_ANSWER_FILE_NAME,
+        ):
+            try:
+                mtimes.append((day_dir / field_file_name).stat().st_mtime_ns)
+            except FileNotFoundError:
+                mtimes.append(None)
+
+        return tuple(mtimes)
+
+    def _load(self, year: int, day: int) -> PuzzleData:
         input = self._load_field(year, day, INPUT_FILE_NAME, unobscure=True)
 
         if input is None:
             raise PuzzleStoreFileMissing(
-                year=year, day=day, file_path=self.repo_dir / f"y{year}" / str(day)
+                year=year, day=day, file_path=self._day_dir(year, day)
             )
 
         part_one_answer_data = self._load_field(year, day, PART_ONE_ANSWER_FILE_NAME)
@@ -321,21 +392,20 @@ class FileBackedPuzzleStore(PuzzleStore):
     def _load_field(
         self, year: int, day: int, field_file_name: str, unobscure: bool = False
     ) -> str | None:
-        input_path = self.repo_dir / f"y{year}" / str(day) / field_file_name
+        input_path = self._day_dir(year, day) / field_file_name
 
-        if not input_path.exists():
+        try:
+            file_bytes = input_path.read_bytes()
+        except FileNotFoundError:
             return None
-        else:
-            with input_path.open("rb") as f:
-                file_bytes = f.read()
 
-                if unobscure:
-                    return _decrypt_str(file_bytes, self.password)
-                else:
-                    return file_bytes.decode("utf-8")
+        if unobscure:
+            return _decrypt_str(file_bytes, self.password)
+        else:
+            return file_bytes.decode("utf-8")
 
     def set(self, year: int, day: int, input: PuzzleData):
-        day_dir = self.repo_dir / f"y{year}" / str(day)
+        day_dir = self._day_dir(year, day)
 
         # Create the directory for the day if it does not already exist.
         if not day_dir.exists():
@@ -352,6 +422,11 @@ class FileBackedPuzzleStore(PuzzleStore):
         if part_two_answer_data != "":
             self._save_field(year, day, PART_TWO_ANSWER_FILE_NAME, part_two_answer_data)
 
+        self._puzzles[(year, day)] = (
+            self._field_mtimes(year, day),
+            copy.deepcopy(input),
+        )
+
     def _save_field(
         self,
         year: int,
@@ -360,17 +435,17 @@ class FileBackedPuzzleStore(PuzzleStore):
         value: str,
         obscure: bool = False,
     ):
-        with (self.repo_dir / f"y{year}" / str(day) / field_file_name).open("wb") as f:
-            if obscure:
-                f.write(_encrypt_str(value, self.password))
-            else:
-                f.write(value.encode("utf-8"))
+        (self._day_dir(year, day) / field_file_name).write_bytes(
+            _encrypt_str(value, self.password) if obscure else value.encode("utf-8")
+        )
 
     def add_day(self, year: int, day: int, input: str):
         self.set(year, day, PuzzleData(input, PartAnswerCache(), PartAnswerCache()))
 
     def has_day(self, year: int, day: int) -> bool:
-        input_file = self.repo_dir / f"y{year}" / str(day) / INPUT_FILE_NAME
+        # Always check the file system rather than the puzzles held in memory,
+        # which may be stale if the day's files were deleted.
+        input_file = self._day_dir(year, day) / INPUT_FILE_NAME
         return input_file.exists()
 
     def days(self, year: int) -> list[int]:
@@ -386,6 +461,8 @@ class FileBackedPuzzleStore(PuzzleStore):
 class MemoryBackedDataStore:
     """Stores inputs in memory without backing storage."""
 
+    __slots__ = ("inputs",)
+
     def __init__(self) -> None:
         super().__init__()
         self.inputs: dict[int, str] = dict()
@@ -418,8 +495,11 @@ KDF_LENGTH = 32
 KDF_ITERATIONS = 10
 
 
-def _encrypt_str(plaintext: str, password: str) -> bytes:
-    # Derive a symmetric key using the passsword and a fresh random salt.
+@functools.lru_cache(maxsize=8)
+def _fernet_for(password: str) -> Fernet:
+    """Returns a Fernet cipher keyed with `password`. The key derivation only
+    runs once per password rather than for every field that is read or
+    written."""
     kdf = PBKDF2HMAC(
         algorithm=KDF_ALGORITHM,
         length=KDF_LENGTH,
@@ -428,25 +508,12 @@ def _encrypt_str(plaintext: str, password: str) -> bytes:
     )
     key = kdf.derive(password.encode("utf-8"))
 
-    # Encrypt the message.
-    f = Fernet(base64.urlsafe_b64encode(key))
-    ciphertext = f.encrypt(plaintext.encode("utf-8"))
-
-    return ciphertext
+    return Fernet(base64.urlsafe_b64encode(key))
 
 
-def _decrypt_str(ciphertext: bytes, password: str) -> str:
-    # Derive the symmetric key using the password and provided salt.
-    kdf = PBKDF2HMAC(
-        algorithm=KDF_ALGORITHM,
-        length=KDF_LENGTH,
-        salt=FIXED_SALT,
-        iterations=KDF_ITERATIONS,
-    )
-    key = kdf.derive(password.encode("utf-8"))
+def _encrypt_str(plaintext: str, password: str) -> bytes:
+    return _fernet_for(password).encrypt(plaintext.encode("utf-8"))
 
-    # Decrypt the message
-    f = Fernet(base64.urlsafe_b64encode(key))
-    plaintext = f.decrypt(ciphertext)
 
-    return plaintext.decode("utf-8")
+def _decrypt_str(ciphertext: bytes, password: str) -> str:
+    return _fernet_for(password).decrypt(ciphertext).decode("utf-8")
@@ -3,11 +3,17 @@ from pathlib import Path
 from typing import Generator
 
 import importlib
+import importlib.util
 import os
 import re
+import sys
 
 
-@dataclass
+_YEAR_DIR_RE = re.compile("^y(\\d{4,4})$")
+_DAY_FILE_RE = re.compile("^day(\\d{1,2})\\.py$")
+
+
+@dataclass(slots=True)
 class SolutionPlugin:
     module_path: Path
     year: int
@@ -22,43 +28,88 @@ class SolutionPlugin:
         return str(self.module_path)
 
 
-def enumerate_solution_plugins() -> Generator[SolutionPlugin, None, None]:
+def enumerate_solution_plugins(
+    package: str = "advent",
+) -> Generator[SolutionPlugin, None, None]:
     """
     Yields all of the solution plugins in the project.
 
-    A solution plugin is a python file located in `advent/solutions/yYYYY/dayDD.py`
-    with YYYY being the solution year and DD being the solution day.
+    A solution plugin is a python file located in `<package>/yYYYY/dayDD.py`
+    with YYYY being the solution year and DD being the solution day. The
+    package is located without being imported.
     """
-    # Look for all the years located in the solutions directory.
-    year_dir_re = re.compile("^y(\\d{4,4})$")
-    day_dir_re = re.compile("^day(\\d{1,2})\\.py$")
+    package_spec = importlib.util.find_spec(package)
+
+    if package_spec is None or package_spec.submodule_search_locations is None:
+        return
+
+    for package_dir in package_spec.submodule_search_locations:
+        # Look for all the years located in the solutions directory. The
+        # directory entries from `os.scandir` know if they are a directory
+        # without needing an extra `stat` call per entry.
+        with os.scandir(package_dir) as plugin_dir_entries:
+            for plugin_dir_entry in plugin_dir_entries:
+                match = _YEAR_DIR_RE.match(plugin_dir_entry.name)
+
+                # Only enumerate directories that match the years naming pattern.
+                if match and plugin_dir_entry.is_dir():
+                    # This is a solutions directory for a specific year! Extract
+                    # the actual year value from the match.
+                    year = int(match.group(1))
+                    path = Path(plugin_dir_entry.path)
+
+                    # Enumerate this directory and look for python modules that
+                    # match the per-day naming pattern.
+                    with os.scandir(path) as year_dir_entries:
+                        for year_dir_entry in year_dir_entries:
+                            match = _DAY_FILE_RE.match(year_dir_entry.name)
 
-    solver_plugin_dir = Path("advent/solutions")
+                            if match:
+                                day = int(match.group(1))
+                                yield SolutionPlugin(
+                                    path / year_dir_entry.name, year, day
+                                )
 
-    for plugin_dir_entry in os.listdir(solver_plugin_dir):
-        match = year_dir_re.match(plugin_dir_entry)
-        path = solver_plugin_dir / plugin_dir_entry
 
-        # Only enumerate directories that match the years naming pattern.
-        if match and os.path.isdir(path):
-            # This is a solutions directory for a specific year! Extract the
-            # actual year value from the match.
-            year = int(match.group(1))
+def load_solutions(
+    year: int | None = None, days: list[int] | None = None, package: str = "advent"
+):
+    """
+    Loads the solution plugins located in the package `<package>.yNNNN.dayNN`.
+    Only the plugins for `year` and `days` are loaded when they are given.
+    """
+    if year is not None and days:
+        # The module names are already known so there is no need to walk the
+        # package directories. Days without a solution are skipped, as they
+        # would be when enumerating.
+        for day in days:
+            module_name = f"{package}.y{year}.day{day}"
+
+            try:
+                spec = importlib.util.find_spec(module_name)
+            except ModuleNotFoundError:
+                # The year package itself does not exist.
+                return
 
-            # Enumerate this directory and look for python modules that match
-            # the per-day naming pattern.
-            for year_dir_entry in os.listdir(solver_plugin_dir / plugin_dir_entry):
-                path = solver_plugin_dir / plugin_dir_entry / year_dir_entry
-                match = day_dir_re.match(year_dir_entry)
+            if spec is not None:
+                _cached_import(module_name)
 
-                if match:
-                    day = int(match.group(1))
-                    yield SolutionPlugin(path, year, day)
+        return
 
+    for plugin in enumerate_solution_plugins(package):
+        if (year is None or plugin.year == year) and (not days or plugin.day in days):
+            _cached_import(f"{package}.y{plugin.year}.day{plugin.day}")
 
-def load_all_solutions():
+
+def load_all_solutions(package: str = "advent"):
     """
-    Loads all of the solution plugins that are located in the package advent.solutions.yNNNN.dNN
+    Loads all of the solution plugins that are located in the package `<package>.yNNNN.dayNN`
     """
-    for plugin in enumerate_solution_plugins():
-        importlib.import_module(f"advent.solutions.y{plugin.year}.day{plugin.day}")
+    load_solutions(package=package)
+
+
+def _cached_import(module_name: str):
+    """Returns the module named `module_name`, only going through the import
+    machinery if it has not been imported already."""
+    module = sys.modules.get(module_name)
+    return module if module is not None else importlib.import_module(module_name)
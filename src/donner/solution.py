@@ -1,8 +1,10 @@
+import sys
 from abc import ABC, abstractmethod
+from bisect import insort
+from collections import deque
 from collections.abc import Callable
 from enum import Enum
 from typing import Generator
-import os
 
 DEFAULT_VARIANT_NAME = "default"
 
@@ -18,12 +20,10 @@ class Part(Enum):
     Two = 2
 
     def __str__(self) -> str:
-        if self == Part.One:
-            return "Part one"
-        elif self == Part.Two:
-            return "Part two"
-        else:
-            raise Exception("Unhandled enum case in Part __str__")
+        return _PART_NAMES[self]
+
+
+_PART_NAMES = {Part.One: "Part one", Part.Two: "Part two"}
 
 
 class AbstractSolver(ABC):
@@ -37,6 +37,12 @@ class AbstractSolver(ABC):
     def part_two(self, input: str) -> MaybeAnswerType:
         pass
 
+    def reset(self) -> None:
+        """Called after the solver has run on an input, before it is used to
+        run another. Solvers that keep state between calls should clear it
+        here."""
+        pass
+
     def get_part_func(self, part: Part) -> Callable[[str], MaybeAnswerType]:
         """Returns the solver's `part_one` function if `part == Part.One` otherwise the `part_two` function is returned"""
         if part == Part.One:
@@ -50,20 +56,23 @@ class Example:
     Provides an input example and the expected output for either part one or
     part two for a solver. Examples tend to be small, contrived examples
     similiar in scope to a unit or integration test.
+
+    Inputs given as a list of lines are joined with LF line endings.
     """
 
+    __slots__ = ("input", "output", "part", "_hash")
     input: str
     output: str
     part: Part
+    _hash: int
 
     def __init__(self, input: str | list[str], output: str, part: Part):
-        if isinstance(input, str):
-            self.input = input
-        else:
-            self.input = os.linesep.join(input)
+        # Puzzle inputs always use `\n` line endings regardless of platform.
+        self.input = input if isinstance(input, str) else "\n".join(input)
 
         self.output = output
         self.part = part
+        self._hash = -1
 
     def __eq__(self, value: object) -> bool:
         if type(value) is Example:
@@ -75,6 +84,16 @@ class Example:
         else:
             return False
 
+    def __hash__(self) -> int:
+        # Examples are not modified after construction so the hash is computed
+        # once on first use and cached.
+        h = self._hash
+
+        if h == -1:
+            h = self._hash = hash((self.input, self.output, self.part.value))
+
+        return h
+
     def __repr__(self) -> str:
         return f"Example(input={self.input}, output={self.output}, part={self.part})"
 
@@ -84,9 +103,19 @@ class SolverMetadata:
     Stores an abstract solver type and other metadata associated with the solver.
     """
 
+    __slots__ = (
+        "klass",
+        "_part_one_examples",
+        "_part_two_examples",
+        "_day",
+        "_year",
+        "_puzzle_name",
+        "_variant_name",
+        "_is_slow",
+    )
     klass: type[AbstractSolver]
-    _part_one_examples: list[Example]
-    _part_two_examples: list[Example]
+    _part_one_examples: deque[Example]
+    _part_two_examples: deque[Example]
     _day: int
     _year: int
     _puzzle_name: str
@@ -109,12 +138,16 @@ class SolverMetadata:
         self._puzzle_name = (
             puzzle_name if puzzle_name is not None else f"{year} day {day}"
         )
+        # Variant names are used as registry keys so intern them to let lookups
+        # short circuit on identity.
         self._variant_name = (
-            variant_name if variant_name is not None else DEFAULT_VARIANT_NAME
+            sys.intern(variant_name)
+            if variant_name is not None
+            else DEFAULT_VARIANT_NAME
         )
         self._is_slow: bool = is_slow
-        self._part_one_examples = list()
-        self._part_two_examples = list()
+        self._part_one_examples = deque()
+        self._part_two_examples = deque()
 
         if examples is not None:
             for example in examples:
@@ -144,9 +177,9 @@ class SolverMetadata:
     def add_example(self, example: Example):
         """Appends `example` to the start of this solver's examples list."""
         if example.part == Part.One:
-            self._part_one_examples.insert(0, example)
+            self._part_one_examples.appendleft(example)
         else:
-            self._part_two_examples.insert(0, example)
+            self._part_two_examples.appendleft(example)
 
     def examples(self, part: Part) -> Generator[Example, None, None]:
         if part == Part.One:
@@ -175,128 +208,161 @@ class DuplicateSolverType(Exception):
         super().__init__(f"Cannot register {solver_type} more than once")
 
 
+class DuplicateSolverVariant(Exception):
+    def __init__(self, year: int, day: int, variant: str):
+        super().__init__(
+            f"Cannot register more than one solver variant named {variant} "
+            f"for year {year} day {day}"
+        )
+
+
 class SolverRegistry:
     """
     Stores a list of solvers for a given year and day.
     """
 
-    solvers: dict[tuple[int, int], list[type[AbstractSolver]]]
+    solvers: dict[int, dict[int, dict[str, type[AbstractSolver]]]]
     metadata: dict[type[AbstractSolver], SolverMetadata]
-    examples_scratch: dict[type[AbstractSolver], tuple[list[Example], list[Example]]]
+    examples_scratch: dict[type[AbstractSolver], tuple[deque[Example], deque[Example]]]
+    _days_by_year: dict[int, list[int]]
+    _years: list[int]
 
     def __init__(self):
         self.solvers = dict()
         self.metadata = dict()
         self.examples_scratch = dict()
+        self._days_by_year = dict()
+        self._years = list()
 
     def add_metadata(self, solver: SolverMetadata):
         """Adds metadata for a new solver class."""
+        variants = self.solvers.get(solver.year(), {}).get(solver.day())
+
         # Associate the metadata to the solver class.
         if solver.klass in self.metadata:
             raise DuplicateSolverType(solver.klass)
+        elif variants is not None and solver.variant_name() in variants:
+            raise DuplicateSolverVariant(
+                solver.year(), solver.day(), solver.variant_name()
+            )
         else:
             self.metadata[solver.klass] = solver
 
         # Move any examples that have been registered for this type from scratch
         # into this metadata value.
-        if solver.klass in self.examples_scratch:
-            for e in reversed(self.examples_scratch[solver.klass][0]):
+        scratch = self.examples_scratch.pop(solver.klass, None)
+
+        if scratch is not None:
+            for e in reversed(scratch[0]):
                 solver.add_example(e)
-            for e in reversed(self.examples_scratch[solver.klass][1]):
+            for e in reversed(scratch[1]):
                 solver.add_example(e)
 
-            del self.examples_scratch[solver.klass]
+        # Add a solver entry for this day + year, keyed by the variant name.
+        if variants is None:
+            variants = self.solvers.setdefault(solver.year(), {})[solver.day()] = {}
 
-        # Add a solver entry for this day + year.
-        entry_key = (solver.year(), solver.day())
+            # Keep each year's days (and the years themselves) sorted as they
+            # are added rather than sorting them every time they are requested.
+            if solver.year() not in self._days_by_year:
+                insort(self._years, solver.year())
 
-        if (solver.year(), solver.day()) not in self.solvers:
-            self.solvers[entry_key] = []
+            insort(self._days_by_year.setdefault(solver.year(), []), solver.day())
 
-        self.solvers[entry_key].append(solver.klass)
+        variants[solver.variant_name()] = solver.klass
 
     def add_example(self, solver_class: type[AbstractSolver], example: Example):
         """Appends `example` to the start of the list of examples for solver `solver_class`."""
 
         # Add the example directly to the solver's metadata if it exists.
-        if solver_class in self.metadata:
-            self.metadata[solver_class].add_example(example)
+        metadata = self.metadata.get(solver_class)
+
+        if metadata is not None:
+            metadata.add_example(example)
         else:
             # Otherwise add the exapmles to scratch so it can be added once the
             # metadata info is added.
-            if solver_class not in self.examples_scratch:
-                self.examples_scratch[solver_class] = (list(), list())
-
-            if example.part == Part.One:
-                self.examples_scratch[solver_class][0].insert(0, example)
-            else:
-                self.examples_scratch[solver_class][1].insert(0, example)
+            scratch = self.examples_scratch.setdefault(solver_class, (deque(), deque()))
+            scratch[0 if example.part == Part.One else 1].appendleft(example)
 
     def get_examples(
         self, solver_class: type[AbstractSolver], part: Part
     ) -> Generator[Example, None, None]:
         # Use the examples from the solver's metadata if available.
-        if solver_class in self.metadata:
-            yield from self.metadata[solver_class].examples(part)
+        metadata = self.metadata.get(solver_class)
+
+        if metadata is not None:
+            yield from metadata.examples(part)
         else:
             # Otherwise use the temporary scratch exmaples.
-            if part == Part.One:
-                yield from self.examples_scratch[solver_class][0]
-            else:
-                yield from self.examples_scratch[solver_class][1]
+            scratch = self.examples_scratch.get(solver_class)
+
+            if scratch is not None:
+                yield from scratch[0 if part == Part.One else 1]
 
     def has_solver_for(self, year: int, day: int) -> bool:
         """Check if there is at least one solver for the given year and day"""
-        return (year, day) in self.solvers
+        return day in self.solvers.get(year, ())
 
     def all_solvers_for(self, year: int, day: int) -> list[SolverMetadata]:
         """Get all of the solver variants for the given year and day"""
-        if (year, day) in self.solvers:
-            return [self.metadata[x] for x in self.solvers[(year, day)]]
+        variants = self.solvers.get(year, {}).get(day)
+
+        if variants is not None:
+            return [self.metadata[x] for x in variants.values()]
         else:
             return []
 
+    def try_find_solver_for(
+        self, year: int, day: int, variant: str | None = None
+    ) -> SolverMetadata | None:
+        """
+        Returns the solver for the given year and day with a matching variant
+        name, or `None` if there is no such solver. If `variant` is `None` the
+        default variant is preferred, otherwise any solver for the day is used.
+        """
+        variants = self.solvers.get(year, {}).get(day)
+
+        if not variants:
+            return None
+
+        # Find a solver with the same variant name.
+        klass = variants.get(variant if variant is not None else DEFAULT_VARIANT_NAME)
+
+        # If no variant name was provided and there was no default variant
+        # then use any available solver.
+        if klass is None and variant is None:
+            klass = next(iter(variants.values()))
+
+        return self.metadata[klass] if klass is not None else None
+
     def find_solver_for(
         self, year: int, day: int, variant: str | None = None
     ) -> SolverMetadata:
-        variant_name = variant if variant is not None else DEFAULT_VARIANT_NAME
-        all_solvers = self.all_solvers_for(year, day)
+        s = self.try_find_solver_for(year, day, variant)
 
-        if all_solvers is None or len(all_solvers) == 0:
+        if s is not None:
+            return s
+        elif not self.has_solver_for(year, day):
             raise NoSolversFound(year=year, day=day)
         else:
-            # Find a solver with the same variant name.
-            for s in all_solvers:
-                if s.variant_name() == variant_name:
-                    return s
-
-            # If no variant name was provided and there was no default variant
-            # then use any available solver before throwing an exception.
-            if variant is None and len(all_solvers) > 0:
-                return all_solvers[0]
-
-            raise SolverVariantNotFound(year=year, day=day, variant=variant_name)
+            raise SolverVariantNotFound(
+                year=year,
+                day=day,
+                variant=variant if variant is not None else DEFAULT_VARIANT_NAME,
+            )
 
     def all_days(self, year: int) -> list[int]:
         """
         Returns a sorted list of days in the requested year that have a solution.
         """
-        days = [k[1] for k in self.solvers if k[0] == year]
-        days.sort()
-        return days
+        return list(self._days_by_year.get(year, ()))
 
     def all_years(self) -> list[int]:
         """
         Returns a sorted list of years that have at least one day with a solution.
         """
-        years: list[int] = []
-
-        for year, _ in self.solvers.keys():
-            if year not in years:
-                years.append(year)
-
-        years.sort()
-        return years
+        return list(self._years)
 
 
 _GLOBAL_SOLVER_REGISTRY: SolverRegistry = SolverRegistry()
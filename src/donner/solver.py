@@ -2,15 +2,28 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
 
+import contextlib
+import multiprocessing
+import multiprocessing.pool
+
 from advent.utils import not_none
 from donner.client import AocClient, SubmitResponse
 from donner.data import AnswerResponse, PartAnswerCache, PuzzleData
-from donner.solution import AnswerType, Example, MaybeAnswerType, Part, SolverMetadata
+from donner.solution import (
+    AbstractSolver,
+    AnswerType,
+    Example,
+    MaybeAnswerType,
+    Part,
+    SolverMetadata,
+)
 
 
 class CheckResult(ABC):
     """Abstract base class for the various conditions that can occur when checking the answer for one of the puzzle parts."""
 
+    __slots__ = ("part", "actual_answer")
+
     part: Part
     actual_answer: MaybeAnswerType
 
@@ -27,6 +40,8 @@ class CheckResult(ABC):
 class CheckResult_Ok(CheckResult):
     """Represents the condition where the answer was correct for the part."""
 
+    __slots__ = ()
+
     def __init__(self, part: Part, actual_answer: AnswerType):
         super().__init__(part, actual_answer)
 
@@ -38,6 +53,8 @@ class CheckResult_Ok(CheckResult):
 class CheckResult_ExampleFailed(CheckResult):
     """Represents the condition where the output of this part didn't match one of the solution's example outputs"""
 
+    __slots__ = ("example",)
+
     example: Example
 
     def __init__(self, actual_answer: MaybeAnswerType, example: Example):
@@ -49,6 +66,8 @@ class CheckResult_ExampleFailed(CheckResult):
 class CheckResult_TooSoon(CheckResult):
     """Represents the condition where too many answers are submitted in too short of a timeframe, and the backend judge is telling us to wait before submitting a new answer"""
 
+    __slots__ = ()
+
     def __init__(self, part: Part, actual_answer: AnswerType):
         super().__init__(part, actual_answer)
 
@@ -57,6 +76,8 @@ class CheckResult_TooSoon(CheckResult):
 class CheckResult_NotFinished(CheckResult):
     """Represents the condition where the answer for this part has not been implemented"""
 
+    __slots__ = ()
+
     def __init__(self, part: Part):
         super().__init__(part, actual_answer=None)
 
@@ -72,6 +93,8 @@ class CheckResult_Skipped(CheckResult):
     Check the `examples` attribute to see which examples passed.
     """
 
+    __slots__ = ("examples",)
+
     examples: list[Example]
 
     def __init__(self, part: Part, examples: list[Example]):
@@ -94,6 +117,8 @@ class CheckResult_Wrong(CheckResult):
     - `hint`:            A hint that `actual_answer` is too low or hi if available, otherwise `None`.
     """
 
+    __slots__ = ("expected_answer", "hint")
+
     expected_answer: MaybeAnswerType
     hint: CheckHint | None
 
@@ -114,6 +139,8 @@ class CheckResult_Wrong(CheckResult):
 class RunSolverResult:
     """Holds the results of running a solver."""
 
+    __slots__ = ("part_one", "part_two")
+
     part_one: CheckResult | None
     part_two: CheckResult | None
 
@@ -195,6 +222,7 @@ def run_solver(
     part: Part | None = None,
     example_index: int | None = None,
     input: str | None = None,
+    parallel: bool = False,
 ) -> RunSolverResult:
     """
     Runs a solver provided by `solver_metadata` on `puzzle` and upon succesful execution attempts to
@@ -217,6 +245,11 @@ def run_solver(
                          argument be specified.
     - `input`:           Optional. Overrides the puzzle's default input with this value when running
                          the solver. Callers must also specify `part` when using this parameter.
+    - `parallel`:        Optional, defaults to False. If this flag is set to True the
+                         examples and the real puzzle input for each part are run in a
+                         pool of worker processes, so they are solved concurrently.
+                         Ignored when `example_index` is given. The solver class must
+                         be importable by the worker processes.
     """
     run_result = RunSolverResult()
 
@@ -239,87 +272,147 @@ def run_solver(
     else:
         parts = (part,)
 
-    # Run the selected parts.
+    # Run the selected parts. The solver factory is looked up once here rather
+    # than for every example that is run.
+    create_solver = solver_metadata.create_solver_instance
     events.on_start_solver(solver_metadata=solver_metadata)
 
-    for part in parts:
-        events.on_start_part(solver_metadata=solver_metadata, part=part)
-
-        # Validate examples listed for the current part prior to running the
-        # part on real input. Use all of the examples associated with the solver
-        # unless the caller has requested a specific example be run.
-        examples_pass = True
-        examples = list(solver_metadata.examples(part))
-
-        if example_index is not None:
-            if example_index < 0 or example_index >= len(examples):
-                raise IndexError(
-                    f"example index {example_index} is out of range (examples count for {part} is {len(examples)})"
+    # When running in parallel start checking every example and solving the
+    # real input for each part in worker processes now. Results are still
+    # checked in order in this process, and the answer for the real input is
+    # only used once its part's examples pass. Leaving the pool's `with` block
+    # terminates its workers, so work whose result is not used (eg the real
+    # input for a part whose examples failed) does not hold up the caller.
+    example_answers: dict[Part, list[multiprocessing.pool.AsyncResult]] = dict()
+    real_answers: dict[Part, multiprocessing.pool.AsyncResult] = dict()
+    pool = multiprocessing.Pool() if parallel and example_index is None else None
+
+    with pool if pool is not None else contextlib.nullcontext():
+        if pool is not None:
+            # Every example is queued ahead of the real inputs so a part's
+            # examples are not held up by another part's real input when there
+            # are fewer workers than parts.
+            for p in parts:
+                example_answers[p] = [
+                    pool.apply_async(
+                        _solve_part, (solver_metadata.klass, p, example.input)
+                    )
+                    for example in solver_metadata.examples(p)
+                ]
+
+            for p in parts:
+                real_answers[p] = pool.apply_async(
+                    _solve_part,
+                    (
+                        solver_metadata.klass,
+                        p,
+                        puzzle.input if input is None else input,
+                    ),
                 )
 
-            examples = [examples[example_index]]
-
-        # Validate the selected examples.
-        for example in examples:
-            solver = solver_metadata.create_solver_instance()
-            answer = str(solver.get_part_func(part)(example.input))
-
-            if example.output != answer:
-                # Example failed - set the result for this part as
-                # "example failed". Stop testing examples for this part.
-                run_result.set_result(
-                    part,
-                    CheckResult_ExampleFailed(actual_answer=answer, example=example),
+        for part in parts:
+            events.on_start_part(solver_metadata=solver_metadata, part=part)
+
+            # One solver instance is shared by the examples and real input for
+            # this part. It is reset between runs so state cannot leak from one
+            # input to the next. Parts run by the worker pool create their own
+            # solvers instead.
+            if pool is None:
+                solver = create_solver()
+                part_func = solver.get_part_func(part)
+
+            # Validate examples listed for the current part prior to running
+            # the part on real input. Use all of the examples associated with
+            # the solver unless the caller has requested a specific example be
+            # run.
+            examples_pass = True
+            examples = list(solver_metadata.examples(part))
+
+            if example_index is not None:
+                if example_index < 0 or example_index >= len(examples):
+                    raise IndexError(
+                        f"example index {example_index} is out of range "
+                        f"(examples count for {part} is {len(examples)})"
+                    )
+
+                examples = [examples[example_index]]
+
+            # Validate the selected examples.
+            pooled_answers = example_answers.get(part)
+
+            for i, example in enumerate(examples):
+                if pooled_answers is not None:
+                    answer = str(pooled_answers[i].get())
+                else:
+                    answer = str(part_func(example.input))
+                    solver.reset()
+
+                if example.output != answer:
+                    # Example failed - set the result for this part as
+                    # "example failed". Stop testing examples for this part.
+                    run_result.set_result(
+                        part,
+                        CheckResult_ExampleFailed(
+                            actual_answer=answer, example=example
+                        ),
+                    )
+
+                    examples_pass = False
+                    break
+
+            # Notify the event manager that examples have passed, otherwise if
+            # any have failed then skip running the part with real input.
+            if examples_pass:
+                events.on_part_examples_pass(
+                    solver_metadata=solver_metadata, part=part, count=len(examples)
+                )
+            else:
+                events.on_finish_part(
+                    solver_metadata=solver_metadata,
+                    part=part,
+                    result=not_none(run_result.get_result(part=part)),
                 )
 
-                examples_pass = False
-                break
+                continue
+
+            # Run the solver against real puzzle input so long as the caller
+            # didn't request a specific example to be run (implying that the
+            # real input shouldn't be used).
+            if example_index is None:
+                if part in real_answers:
+                    answer = real_answers[part].get()
+                else:
+                    answer = part_func(puzzle.input if input is None else input)
+
+                result = check_solution_part(
+                    solver_metadata=solver_metadata,
+                    part=part,
+                    answer=answer,
+                    answer_cache=puzzle.get_answer(part=part),
+                    client=client,
+                    submit_answer=submit_answer,
+                )
+            else:
+                result = CheckResult_Skipped(part=part, examples=examples)
 
-        # Notify the event manager that examples have passed, otherwise if any
-        # have failed then skip running the part with real input.
-        if examples_pass:
-            events.on_part_examples_pass(
-                solver_metadata=solver_metadata, part=part, count=len(examples)
-            )
-        else:
+            # Set the final result for this part and notify the event manager
+            # that the part has finished running.
+            run_result.set_result(part, result)
             events.on_finish_part(
-                solver_metadata=solver_metadata,
-                part=part,
-                result=not_none(run_result.get_result(part=part)),
-            )
-
-            continue
-
-        # Run the solver against real puzzle input so long as the caller didn't
-        # request a specific example to be run (implying that the real input
-        # shouldn't be used).
-        if example_index is None:
-            solver = solver_metadata.create_solver_instance()
-            answer = solver.get_part_func(part)(
-                puzzle.input if input is None else input
+                solver_metadata=solver_metadata, part=part, result=result
             )
 
-            result = check_solution_part(
-                solver_metadata=solver_metadata,
-                part=part,
-                answer=answer,
-                answer_cache=puzzle.get_answer(part=part),
-                client=client,
-                submit_answer=submit_answer,
-            )
-        else:
-            result = CheckResult_Skipped(part=part, examples=examples)
-
-        # Set the final result for this part and notify the event manager that
-        # the part has finished running.
-        run_result.set_result(part, result)
-        events.on_finish_part(solver_metadata=solver_metadata, part=part, result=result)
-
     # All done - either good or bad return the results.
     events.on_finish_solver(solver_metadata=solver_metadata, result=run_result)
     return run_result
 
 
+def _solve_part(klass: type[AbstractSolver], part: Part, input: str) -> MaybeAnswerType:
+    """Runs `part` of a new `klass` solver on `input`. Used by `run_solver` to
+    solve parts in worker processes."""
+    return klass().get_part_func(part)(input)
+
+
 def check_solution_part(
     solver_metadata: SolverMetadata,
     part: Part,
@@ -360,23 +453,26 @@ def check_solution_part(
     # the provided AOC client to submit the solution and see what the result
     # is.
     if answer_response == AnswerResponse.Unknown and submit_answer:
+        # Answers are submitted and recorded as text, so only format the answer
+        # once for both.
+        answer_str = str(answer)
         submit_response = client.submit_answer(
             year=solver_metadata.year(),
             day=solver_metadata.day(),
             part=part,
-            answer=str(answer),
+            answer=answer_str,
         )
 
         if (
             submit_response == SubmitResponse.Ok
             or submit_response == SubmitResponse.AlreadyAnswered
         ):
-            answer_cache.set_correct_answer(str(answer))
+            answer_cache.set_correct_answer(answer_str)
             return CheckResult_Ok(part, answer)
         elif submit_response == SubmitResponse.TooSoon:
             return CheckResult_TooSoon(part, answer)
         elif submit_response == SubmitResponse.Wrong:
-            answer_cache.add_wrong_answer(str(answer))
+            answer_cache.add_wrong_answer(answer_str)
             return CheckResult_Wrong(
                 part=part,
                 actual_answer=answer,
@@ -0,0 +1,74 @@
+from pathlib import Path
+from unittest import mock
+import unittest
+
+from donner.cli import AdventUserException, cli_main
+from donner.plugins import SolutionPlugin
+from donner.solution import (
+    AbstractSolver,
+    MaybeAnswerType,
+    SolverMetadata,
+    SolverRegistry,
+)
+
+
+class Solution_2000_1(AbstractSolver):
+    def part_one(self, input: str) -> MaybeAnswerType:
+        return None
+
+    def part_two(self, input: str) -> MaybeAnswerType:
+        return None
+
+
+class CliMainTests(unittest.TestCase):
+    def run_cli(
+        self,
+        argv: list[str],
+        registry: SolverRegistry,
+        plugins: list[SolutionPlugin],
+        load_solutions,
+    ):
+        with (
+            mock.patch("sys.argv", ["advent", *argv]),
+            mock.patch("donner.cli.get_global_solver_registry", return_value=registry),
+            mock.patch("donner.cli.enumerate_solution_plugins", return_value=plugins),
+            mock.patch("donner.cli.prefetch_inputs"),
+            mock.patch("donner.cli.solve") as solve,
+        ):
+            cli_main(load_solutions=load_solutions)
+
+        return solve
+
+    def test_solve_defaults_to_latest_year(self):
+        calls = []
+        plugins = [
+            SolutionPlugin(Path("y1999/day25.py"), year=1999, day=25),
+            SolutionPlugin(Path("y2000/day1.py"), year=2000, day=1),
+        ]
+
+        solve = self.run_cli(
+            ["solve", "25"],
+            SolverRegistry(),
+            plugins,
+            lambda year, days: calls.append((year, days)),
+        )
+
+        # Day 25 only has a solution in an older year, but the latest year is
+        # still used so the missing solution is reported.
+        self.assertEqual(calls, [(2000, [25])])
+        solve.assert_called_once()
+        self.assertEqual(solve.call_args.kwargs["year"], 2000)
+        self.assertEqual(solve.call_args.kwargs["day"], 25)
+
+    def test_solve_defaults_to_latest_registered_year(self):
+        registry = SolverRegistry()
+        registry.add_metadata(SolverMetadata(Solution_2000_1, day=1, year=2000))
+
+        solve = self.run_cli(["solve", "1"], registry, [], None)
+
+        solve.assert_called_once()
+        self.assertEqual(solve.call_args.kwargs["year"], 2000)
+
+    def test_solve_without_any_solutions(self):
+        with self.assertRaises(AdventUserException):
+            self.run_cli(["solve", "25"], SolverRegistry(), [], lambda year, days: None)
@@ -1,4 +1,19 @@
-from donner.client import AocClientConfig, SubmitResponse
+from donner.client import (
+    AocClient,
+    AocClientConfig,
+    AocDay,
+    AocWebClient,
+    DiskCache,
+    SubmitResponse,
+    UnknownPostAnswerError,
+    _config_cache,
+    parse_calendar_days,
+    parse_submit_response,
+)
+from donner.solution import Part
+from pathlib import Path
+import os
+import tempfile
 import unittest
 
 
@@ -9,8 +24,60 @@ class SubmitResponseTests(unittest.TestCase):
         self.assertFalse(SubmitResponse.AlreadyAnswered.is_wrong())
 
         self.assertTrue(SubmitResponse.Wrong.is_wrong())
+        self.assertTrue(SubmitResponse.TooLow.is_wrong())
         self.assertTrue(SubmitResponse.TooHigh.is_wrong())
-        self.assertTrue(SubmitResponse.TooHigh.is_wrong())
+
+
+class FakeAocClient(AocClient):
+    def fetch_input_for(self, year: int, day: int) -> str:
+        return f"input for {year} day {day}"
+
+    def fetch_days(self, year: int) -> list[AocDay]:
+        raise NotImplementedError
+
+    def submit_answer(
+        self, year: int, day: int, part: Part, answer: str
+    ) -> SubmitResponse:
+        raise NotImplementedError
+
+
+class AocClientTests(unittest.TestCase):
+    def test_fetch_inputs_for(self):
+        self.assertEqual(
+            FakeAocClient().fetch_inputs_for([(2022, 1), (2023, 5)]),
+            {(2022, 1): "input for 2022 day 1", (2023, 5): "input for 2023 day 5"},
+        )
+
+
+class AocWebClientTests(unittest.TestCase):
+    def test_session_created_on_first_use(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            client = AocWebClient(
+                AocClientConfig(password="foo", session_id="123"),
+                cache_dir=Path(temp_dir),
+            )
+            self.assertIsNone(client._session)
+
+            session = client.session
+            self.assertEqual(session.headers["Cookie"], "session=123")
+            self.assertIn("github.com/smacdo/advent", session.headers["User-Agent"])
+            self.assertIs(client.session, session)
+
+            client.close()
+            self.assertIsNone(client._session)
+
+    def test_answer_submissions_are_not_retried(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            client = AocWebClient(
+                AocClientConfig(password="foo", session_id="123"),
+                cache_dir=Path(temp_dir),
+            )
+            retries = client.session.get_adapter("https://").max_retries
+
+            self.assertTrue(retries.is_retry("GET", 503))
+            self.assertFalse(retries.is_retry("POST", 503))
+
+            client.close()
 
 
 class AocClientConfigTests(unittest.TestCase):
@@ -21,3 +88,123 @@ class AocClientConfigTests(unittest.TestCase):
 
         self.assertEqual(config.password, "foobar")
         self.assertEqual(config.session_id, "180213312312")
+
+    def test_parse_skips_comments_and_lines_without_values(self):
+        config = AocClientConfig.load_from_str(
+            "# comment = ignored\n\npassword=foo=bar\nnot a setting\nsession_id=1\n"
+        )
+
+        self.assertEqual(config.password, "foo=bar")
+        self.assertEqual(config.session_id, "1")
+
+    def test_load_from_file_reloads_when_modified(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            config_path = Path(tempdir) / ".aoc_config"
+            config_path.write_text("password=foo\nsession_id=123\n")
+
+            config = AocClientConfig.load_from_file(str(config_path))
+            self.assertIs(AocClientConfig.load_from_file(str(config_path)), config)
+
+            config_path.write_text("password=bar\nsession_id=456\n")
+            os.utime(config_path, ns=(0, config_path.stat().st_mtime_ns + 1))
+
+            config = AocClientConfig.load_from_file(str(config_path))
+            self.assertEqual(config.password, "bar")
+            self.assertEqual(config.session_id, "456")
+
+            # Reloading replaces the cached config rather than adding another.
+            cached_mtime, cached_config = _config_cache[os.path.abspath(config_path)]
+            self.assertEqual(cached_mtime, config_path.stat().st_mtime_ns)
+            self.assertIs(cached_config, config)
+
+
+class DiskCacheTests(unittest.TestCase):
+    def test_get_missing_key_returns_none(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            cache = DiskCache(Path(tempdir))
+            self.assertIsNone(cache.get("y2022/calendar.html"))
+
+    def test_put_and_read_back(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            cache = DiskCache(Path(tempdir))
+
+            cache.put("y2022/calendar.html", "hello world")
+            self.assertEqual(cache.get("y2022/calendar.html"), "hello world")
+
+            cache.put("y2022/calendar.html", "replaced")
+            self.assertEqual(cache.get("y2022/calendar.html"), "replaced")
+
+    def test_remove(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            cache = DiskCache(Path(tempdir))
+
+            cache.put("y2022/calendar.html", "hello world")
+            cache.remove("y2022/calendar.html")
+            cache.remove("y2022/does_not_exist.html")
+
+            self.assertIsNone(cache.get("y2022/calendar.html"))
+
+
+class AocDayTests(unittest.TestCase):
+    def test_str_shows_stars(self):
+        self.assertEqual(str(AocDay(2022, 3, False, False)), "3")
+        self.assertEqual(str(AocDay(2022, 3, True, False)), "3*")
+        self.assertEqual(str(AocDay(2022, 3, True, True)), "3**")
+        self.assertEqual(str(AocDay(2022, 3, False, True)), "3**")
+
+
+class ParseCalendarDaysTests(unittest.TestCase):
+    def test_parse_days_and_stars(self):
+        page = """
+            <pre class="calendar">
+            <a aria-label="Day 2, one star" href="/2022/day/2"
+               class="calendar-day2 calendar-complete">...</a>
+            <a aria-label="Day 1, two stars" href="/2022/day/1"
+               class="calendar-day1 calendar-verycomplete">...</a>
+            <a href="/2022/day/3" class="calendar-day3">...</a>
+            <span aria-hidden="true" class="calendar-day4">...</span>
+            </pre>
+            <a href="/2022/about">[About]</a>
+        """
+
+        days = parse_calendar_days(2022, page)
+
+        self.assertEqual([d.day for d in days], [1, 2, 3])
+        self.assertEqual([d.year for d in days], [2022, 2022, 2022])
+        self.assertEqual([str(d) for d in days], ["1**", "2*", "3"])
+
+
+class ParseSubmitResponseTests(unittest.TestCase):
+    def test_parse_responses(self):
+        responses = [
+            (
+                "That's the right answer! You are one gold star closer.",
+                SubmitResponse.Ok,
+            ),
+            ("That's not the right answer. If you're stuck...", SubmitResponse.Wrong),
+            (
+                "That's not the right answer; your answer is too low.",
+                SubmitResponse.TooLow,
+            ),
+            (
+                "That's not the right answer; your answer is too high.",
+                SubmitResponse.TooHigh,
+            ),
+            (
+                "You gave an answer too recently; you have to wait.",
+                SubmitResponse.TooSoon,
+            ),
+            (
+                "You don't seem to be solving the right level.  "
+                "Did you already complete it?",
+                SubmitResponse.AlreadyAnswered,
+            ),
+        ]
+
+        for message, expected in responses:
+            page = f"<main><article><p>{message}</p></article></main>"
+            self.assertEqual(parse_submit_response(page), expected, message)
+
+    def test_unknown_response_raises_exception(self):
+        with self.assertRaises(UnknownPostAnswerError):
+            parse_submit_response("<main><article><p>Hello</p></article></main>")
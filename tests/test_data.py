@@ -5,12 +5,23 @@ from donner.data import (
     PuzzleData,
 )
 from pathlib import Path
+import shutil
 import unittest
 import tempfile
 
 from donner.solution import Part
 
 
+class AnswerResponseTests(unittest.TestCase):
+    def test_is_wrong(self):
+        self.assertFalse(AnswerResponse.Ok.is_wrong())
+        self.assertFalse(AnswerResponse.Unknown.is_wrong())
+
+        self.assertTrue(AnswerResponse.Wrong.is_wrong())
+        self.assertTrue(AnswerResponse.TooLow.is_wrong())
+        self.assertTrue(AnswerResponse.TooHigh.is_wrong())
+
+
 class PuzzleDataTests(unittest.TestCase):
     def test_get_part_answer(self):
         part_one_answer = PartAnswerCache(correct_answer="one is right")
@@ -51,6 +62,35 @@ class FileBackedPuzzleStoreTests(unittest.TestCase):
             self.assertEqual(f.get(1969, 1), pd1)
             self.assertEqual(f.get(1969, 5), pd2)
 
+    def test_read_back_from_new_store(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            pd = PuzzleData("hello world", PartAnswerCache("p1a"), PartAnswerCache())
+            FileBackedPuzzleStore(Path(tempdir), password="foobar").set(1969, 3, pd)
+
+            f = FileBackedPuzzleStore(Path(tempdir), password="foobar")
+            self.assertTrue(f.has_day(1969, 3))
+            self.assertEqual(f.get(1969, 3), pd)
+
+    def test_get_returns_copy(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            f = FileBackedPuzzleStore(Path(tempdir), password="foobar")
+            f.add_day(1969, 0, "hello world")
+
+            f.get(1969, 0).part_one_answer.add_wrong_answer("12")
+            self.assertEqual(f.get(1969, 0).part_one_answer, PartAnswerCache())
+
+    def test_get_reloads_when_modified(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            f = FileBackedPuzzleStore(Path(tempdir), password="foobar")
+            f.add_day(1969, 0, "hello world")
+            self.assertEqual(f.get(1969, 0).part_one_answer, PartAnswerCache())
+
+            # Change the answers behind the store's back.
+            pd = PuzzleData("hello world", PartAnswerCache("p1a"), PartAnswerCache())
+            FileBackedPuzzleStore(Path(tempdir), password="foobar").set(1969, 0, pd)
+
+            self.assertEqual(f.get(1969, 0), pd)
+
     def test_set_and_read_back_with_missing_fields(self):
         with tempfile.TemporaryDirectory() as tempdir:
             f = FileBackedPuzzleStore(Path(tempdir), password="foobar")
@@ -130,6 +170,15 @@ class FileBackedPuzzleStoreTests(unittest.TestCase):
             self.assertFalse(f.has_day(1969, 4))
             self.assertFalse(f.has_day(1969, 6))
 
+    def test_has_day_after_files_deleted(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            f = FileBackedPuzzleStore(Path(tempdir), password="foobar")
+            f.add_day(1969, 0, "hello world")
+            self.assertTrue(f.has_day(1969, 0))
+
+            shutil.rmtree(Path(tempdir) / "y1969" / "0")
+            self.assertFalse(f.has_day(1969, 0))
+
     def test_add_day(self):
         with tempfile.TemporaryDirectory() as tempdir:
             f = FileBackedPuzzleStore(Path(tempdir), password="foobar")
@@ -258,6 +307,12 @@ class PartAnswerCacheTests(unittest.TestCase):
         self.assertEqual(pac.check_answer("55.0"), AnswerResponse.Unknown)
         self.assertEqual(pac.check_answer("abc"), AnswerResponse.Unknown)
         self.assertEqual(pac.check_answer("32x"), AnswerResponse.Unknown)
+        self.assertEqual(pac.check_answer("³"), AnswerResponse.Unknown)
+        self.assertEqual(pac.check_answer("٥٥"), AnswerResponse.Unknown)
+        self.assertEqual(pac.check_answer(" 55"), AnswerResponse.Unknown)
+        self.assertEqual(pac.check_answer("+55"), AnswerResponse.Unknown)
+        self.assertEqual(pac.check_answer("5_500"), AnswerResponse.Unknown)
+        self.assertEqual(pac.check_answer("-"), AnswerResponse.Unknown)
 
     def test_wrong_answers_if_in_bounds(self):
         pac = PartAnswerCache(
@@ -336,3 +391,8 @@ class PartAnswerCacheTests(unittest.TestCase):
         self.assertEqual(pac.correct_answer, "hello world")
         self.assertIn("foobar", pac.wrong_answers)
         self.assertIn("one two three", pac.wrong_answers)
+
+    def test_deserialize_invalid_lines_raise_exception(self):
+        for text in ["= ", "X", "? foo", "[ low", "] 1.5"]:
+            with self.assertRaises(ValueError):
+                PartAnswerCache.deserialize(text)
@@ -0,0 +1,33 @@
+from donner.plugins import enumerate_solution_plugins, load_solutions
+import sys
+import unittest
+
+
+class EnumerateSolutionPluginsTests(unittest.TestCase):
+    def test_finds_solutions_by_year_and_day(self):
+        plugins = {(p.year, p.day) for p in enumerate_solution_plugins("advent")}
+
+        self.assertIn((2023, 1), plugins)
+        self.assertIn((2023, 10), plugins)
+        self.assertNotIn((2023, 0), plugins)
+
+    def test_missing_package_has_no_plugins(self):
+        self.assertEqual(list(enumerate_solution_plugins("no_such_package")), [])
+
+
+class LoadSolutionsTests(unittest.TestCase):
+    def test_load_requested_days(self):
+        load_solutions(2023, [1, 2])
+
+        self.assertIn("advent.y2023.day1", sys.modules)
+        self.assertIn("advent.y2023.day2", sys.modules)
+
+    def test_load_skips_missing_days(self):
+        load_solutions(2023, [3, 31])
+
+        self.assertIn("advent.y2023.day3", sys.modules)
+        self.assertNotIn("advent.y2023.day31", sys.modules)
+
+    def test_load_skips_missing_year(self):
+        load_solutions(1999, [1])
+        self.assertNotIn("advent.y1999", sys.modules)
@@ -1,6 +1,7 @@
 from donner.solution import (
     AbstractSolver,
     DuplicateSolverType,
+    DuplicateSolverVariant,
     MaybeAnswerType,
     SolverRegistry,
     SolverMetadata,
@@ -85,6 +86,18 @@ class ExampleTests(unittest.TestCase):
             Example("hello", "world", Part.Two), Example("hello", "world", Part.One)
         )
 
+    def test_hash(self):
+        self.assertEqual(
+            hash(Example("hello", "world", Part.One)),
+            hash(Example(["hello"], "world", Part.One)),
+        )
+        self.assertEqual(
+            len({Example("a", "b", Part.One), Example("a", "b", Part.One)}), 1
+        )
+        self.assertEqual(
+            len({Example("a", "b", Part.One), Example("a", "b", Part.Two)}), 2
+        )
+
 
 class SolverMetadataTests(unittest.TestCase):
     def test_default_name(self):
@@ -146,6 +159,19 @@ class SolverRegistryTests(unittest.TestCase):
             ),
         )
 
+    def test_add_same_variant_twice_raises_exception(self):
+        registry = SolverRegistry()
+        registry.add_metadata(
+            SolverMetadata(klass=Solution_1A, year=2000, day=1, variant_name="A")
+        )
+        self.assertRaises(
+            DuplicateSolverVariant,
+            lambda: registry.add_metadata(
+                SolverMetadata(klass=Solution_1B, year=2000, day=1, variant_name="A")
+            ),
+        )
+        self.assertNotIn(Solution_1B, registry.metadata)
+
     def test_add_multiple_days(self):
         registry = SolverRegistry()
         registry.add_metadata(
@@ -239,6 +265,17 @@ class SolverRegistryTests(unittest.TestCase):
         )
         self.assertSequenceEqual(list(registry.all_days(year=2000)), [1, 2])
 
+    def test_get_days_lists_each_day_once(self):
+        registry = SolverRegistry()
+        registry.add_metadata(
+            SolverMetadata(klass=Solution_1A, year=2000, day=1, variant_name="A")
+        )
+        registry.add_metadata(
+            SolverMetadata(klass=Solution_1B, year=2000, day=1, variant_name="B")
+        )
+        self.assertSequenceEqual(list(registry.all_days(year=2000)), [1])
+        self.assertSequenceEqual(list(registry.all_days(year=2001)), [])
+
     def test_get_years_in_order(self):
         registry = SolverRegistry()
         registry.add_metadata(
@@ -390,6 +427,24 @@ class SolverRegistryTests(unittest.TestCase):
             lambda: registry.find_solver_for(year=2000, day=1, variant="C"),
         )
 
+    def test_try_find_solver_returns_none_when_missing(self):
+        registry = SolverRegistry()
+        registry.add_metadata(
+            SolverMetadata(
+                klass=Solution_1A, year=2000, day=1, puzzle_name="A", variant_name="one"
+            )
+        )
+
+        self.assertIs(
+            registry.try_find_solver_for(2000, 1), registry.metadata[Solution_1A]
+        )
+        self.assertIs(
+            registry.try_find_solver_for(2000, 1, variant="one"),
+            registry.metadata[Solution_1A],
+        )
+        self.assertIsNone(registry.try_find_solver_for(2000, 1, variant="C"))
+        self.assertIsNone(registry.try_find_solver_for(2000, 2))
+
     def test_add_examples_no_existing_metadata(self):
         registry = SolverRegistry()
 
@@ -486,3 +541,8 @@ class SolverRegistryTests(unittest.TestCase):
         self.assertSequenceEqual(
             list(registry.get_examples(Solution_1A, Part.Two)), [e4, e3]
         )
+
+    def test_get_examples_for_unknown_solver_is_empty(self):
+        registry = SolverRegistry()
+        self.assertSequenceEqual(list(registry.get_examples(Solution_1A, Part.One)), [])
+        self.assertSequenceEqual(list(registry.get_examples(Solution_1A, Part.Two)), [])
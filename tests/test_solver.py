@@ -1,4 +1,6 @@
 from typing import List
+import multiprocessing
+import time
 import unittest
 
 from donner.client import AocDay, AocClient, SubmitResponse
@@ -51,6 +53,39 @@ class DecoratedTestSolution(AbstractSolver):
         return "part_two_ok"
 
 
+class StatefulTestSolution(AbstractSolver):
+    """Returns how many inputs it has seen since it was last reset."""
+
+    instances: int = 0
+
+    def __init__(self):
+        StatefulTestSolution.instances += 1
+        self.runs = 0
+
+    def part_one(self, input: str) -> MaybeAnswerType:
+        self.runs += 1
+        return self.runs
+
+    def part_two(self, input: str) -> MaybeAnswerType:
+        return self.part_one(input)
+
+    def reset(self) -> None:
+        self.runs = 0
+
+
+class SlowTestSolution(AbstractSolver):
+    """Takes a long time to solve any input other than the examples."""
+
+    def part_one(self, input: str) -> MaybeAnswerType:
+        if input != "example":
+            time.sleep(60)
+
+        return "bad_output"
+
+    def part_two(self, input: str) -> MaybeAnswerType:
+        return self.part_one(input)
+
+
 class MockAocClient(AocClient):
     submit_answer_calls: list[tuple[int, int, Part, str]]
     part_one_response: SubmitResponse | None
@@ -1084,6 +1119,97 @@ class RunSolverTests(unittest.TestCase):
             [(solver_m, Part.One, 1)],
         )
 
+    def test_solver_instance_reused_and_reset_between_inputs(self):
+        StatefulTestSolution.instances = 0
+        solver_m = SolverMetadata(
+            klass=StatefulTestSolution,
+            day=5,
+            year=2012,
+            examples=[
+                Example(input="a", output="1", part=Part.One),
+                Example(input="b", output="1", part=Part.One),
+                Example(input="c", output="1", part=Part.Two),
+            ],
+        )
+
+        result = run_solver(
+            solver_m,
+            PuzzleData(
+                input="plz_work",
+                part_one_answer=PartAnswerCache(correct_answer="1"),
+                part_two_answer=PartAnswerCache(correct_answer="1"),
+            ),
+            MockAocClient(),
+            MockSolverEventHandlers(),
+        )
+
+        self.assertEqual(
+            result,
+            RunSolverResult(
+                part_one_result=CheckResult_Ok(Part.One, 1),
+                part_two_result=CheckResult_Ok(Part.Two, 1),
+            ),
+        )
+        self.assertEqual(StatefulTestSolution.instances, 2)
+
+    def test_parallel_parts_match_sequential_results(self):
+        solver_m = SolverMetadata(
+            klass=DecoratedTestSolution,
+            day=5,
+            year=2012,
+            examples=[
+                Example(input="part_one_ok", output="part_one_ok", part=Part.One),
+                Example(input="part_two_fail", output="part_two_ok", part=Part.Two),
+            ],
+        )
+
+        def run(parallel: bool) -> RunSolverResult:
+            return run_solver(
+                solver_m,
+                PuzzleData(
+                    input="int",
+                    part_one_answer=PartAnswerCache(correct_answer="22"),
+                    part_two_answer=PartAnswerCache(correct_answer="-127"),
+                ),
+                MockAocClient(),
+                MockSolverEventHandlers(),
+                parallel=parallel,
+            )
+
+        result = run(parallel=True)
+
+        self.assertEqual(result, run(parallel=False))
+        self.assertEqual(result.part_one, CheckResult_Ok(Part.One, 22))
+        self.assertIs(type(result.part_two), CheckResult_ExampleFailed)
+
+    def test_parallel_does_not_wait_for_unused_real_input(self):
+        solver_m = SolverMetadata(
+            klass=SlowTestSolution,
+            day=5,
+            year=2012,
+            examples=[
+                Example(input="example", output="ok", part=Part.One),
+                Example(input="example", output="ok", part=Part.Two),
+            ],
+        )
+
+        start_time = time.monotonic()
+        result = run_solver(
+            solver_m,
+            PuzzleData("real", PartAnswerCache(), PartAnswerCache()),
+            MockAocClient(),
+            MockSolverEventHandlers(),
+            parallel=True,
+        )
+
+        self.assertIs(type(result.part_one), CheckResult_ExampleFailed)
+        self.assertIs(type(result.part_two), CheckResult_ExampleFailed)
+        self.assertLess(time.monotonic() - start_time, 30)
+
+        # No worker is left behind solving the real input, which would block
+        # the process from exiting until it finished.
+        self.assertEqual(multiprocessing.active_children(), [])
+
     def test_only_run_part_two(self):
         solver_m = SolverMetadata(
             klass=DecoratedTestSolution,